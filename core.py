@@ -12,27 +12,92 @@ Author: John Clark Naldoza
 import os
 import datetime
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional, Union, Set, Tuple
+from typing import List, Optional, Union, Set, Tuple, Iterable, NamedTuple, Sequence, FrozenSet, Callable
 from faker import Faker
 
 class OracleObject:
     """
     Base class representing an Oracle database object
     """
+    __slots__ = ("name", "object_type", "dependencies", "_sql", "_sql_factory")
+    
     def __init__(self, name: str, object_type: str):
         self.name = name
         self.object_type = object_type
         self.dependencies: List[str] = []
-        self.sql: str = ""
+        self._sql: str = ""
+        self._sql_factory: Optional[Callable[[], str]] = None
+        
+    @property
+    def sql(self) -> str:
+        """The SQL of this object, built on first access if set through a factory"""
+        if self._sql_factory is not None:
+            self._sql = self._sql_factory()
+            self._sql_factory = None
+        return self._sql
+        
+    @sql.setter
+    def sql(self, sql: str):
+        self._sql = sql
+        self._sql_factory = None
+        
+    def set_sql_factory(self, factory: Callable[[], str]):
+        """Defer building the SQL of this object until it is first read"""
+        self._sql_factory = factory
         
     def add_dependency(self, dependency: str):
         """Add a dependency to this object"""
         if dependency not in self.dependencies:
             self.dependencies.append(dependency)
             
+    def add_dependencies(self, dependencies: Iterable[str]):
+        """Add several dependencies to this object in one call"""
+        self.dependencies.extend(dep for dep in dict.fromkeys(dependencies)
+                                 if dep not in self.dependencies)
+            
+    def set_dependencies(self, dependencies: Iterable[str]):
+        """Replace the dependencies of this object with the given ones"""
+        self.dependencies = list(dict.fromkeys(dependencies))
+        
+    @classmethod
+    def from_record(cls, name: str, object_type: str, sql: Union[str, Callable[[], str]],
+                    dependencies: Iterable[str] = ()) -> 'OracleObject':
+        """Create an object from a (name, type, SQL, dependencies) record, the SQL may be a factory"""
+        obj = cls(name, object_type)
+        if callable(sql):
+            obj.set_sql_factory(sql)
+        else:
+            obj.sql = sql
+        obj.set_dependencies(dependencies)
+        return obj
+        
+    def to_record(self) -> Tuple[str, str, str, Tuple[str, ...]]:
+        """Get this object as a (name, type, SQL, dependencies) record"""
+        return self.name, self.object_type, self.sql, tuple(self.dependencies)
+        
+    def to_lazy_record(self) -> Tuple[str, str, Union[str, Callable[[], str]], Tuple[str, ...]]:
+        """Like to_record(), but keeps SQL that has not been built yet as its factory"""
+        sql = self._sql_factory if self._sql_factory is not None else self._sql
+        return self.name, self.object_type, sql, tuple(self.dependencies)
+            
     def __str__(self) -> str:
         return f"{self.object_type} {self.name}"
 
+def join_sql_script(objects: Iterable[OracleObject]) -> str:
+    """
+    Join the SQL of objects into a single SQL*Plus script
+    
+    Each object's SQL is terminated by exactly one "/" line.
+    """
+    return "".join(_strip_terminator(obj.sql) + "\n/\n" for obj in objects)
+
+def _strip_terminator(sql: str) -> str:
+    """Strip trailing whitespace and a trailing "/" line terminator from SQL"""
+    sql = sql.rstrip()
+    if sql.endswith("/"):
+        sql = sql[:-1].rstrip()
+    return sql
+
 class OracleObjectGenerator(ABC):
     """
     Abstract base class for Oracle object generators
@@ -50,25 +115,34 @@ class OracleObjectGenerator(ABC):
         """Get the generated objects"""
         return self.objects
 
+class Column(NamedTuple):
+    """A table column definition"""
+    name: str
+    type: str
+    constraints: FrozenSet[str] = frozenset()
+    definition: str = ""  # column clause of CREATE TABLE, e.g. "LAST_NAME VARCHAR2(25) NOT NULL"
+
 class TableInfo:
     """Class to store table information"""
-    def __init__(self, name: str, columns: List[Dict[str, Any]]):
+    __slots__ = ("name", "columns")
+    
+    def __init__(self, name: str, columns: Sequence[Column]):
         self.name = name
         self.columns = columns
         
     def get_primary_key_columns(self) -> List[str]:
         """Get the primary key columns of this table"""
-        return [col['name'] for col in self.columns 
-                if 'constraints' in col and 'PRIMARY KEY' in col['constraints']]
+        return [col.name for col in self.columns 
+                if 'PRIMARY KEY' in col.constraints]
                 
     def get_column_names(self) -> List[str]:
         """Get all column names of this table"""
-        return [col['name'] for col in self.columns]
+        return [col.name for col in self.columns]
         
-    def get_column_by_name(self, name: str) -> Optional[Dict[str, Any]]:
+    def get_column_by_name(self, name: str) -> Optional[Column]:
         """Get a column by name"""
         for col in self.columns:
-            if col['name'] == name:
+            if col.name == name:
                 return col
         return None
 
@@ -7,14 +7,67 @@ Generates PL/SQL package specifications and bodies.
 """
 
 import os
+import sys
 import random
+import hashlib
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Tuple, Union
 
 from core import OracleObjectGenerator, OracleObject, TableInfo
 
 logger = logging.getLogger(__name__)
 
+# Boilerplate shared verbatim by every generated package. Interning keeps a
+# single string object alive no matter how many packages are produced.
+_CONSTANTS_BLOCK = sys.intern(
+    "    -- Constants\n"
+    "    C_MAX_ATTEMPTS CONSTANT INTEGER := 3;\n"
+    "    C_DEFAULT_PAGE_SIZE CONSTANT INTEGER := 25;\n"
+)
+
+_RETURN_FALSE_ON_ERROR = sys.intern('''
+    EXCEPTION
+        WHEN OTHERS THEN
+            RETURN FALSE;
+    END;''')
+
+_FORMATTED_DATE_BODY = sys.intern('''
+    IS
+        v_result VARCHAR2(100);
+    BEGIN
+        RETURN TO_CHAR(p_date, p_format);
+    EXCEPTION
+        WHEN OTHERS THEN
+            RETURN NULL;
+    END;''')
+
+_IS_NUMERIC_BODY = sys.intern('''
+    IS
+    BEGIN
+        RETURN REGEXP_LIKE(p_string, '^[0-9]+$');''' + _RETURN_FALSE_ON_ERROR)
+
+
+def _write_bytes(path: str, data: bytes) -> None:
+    """Write data to path through a raw file descriptor (releases the GIL during write(2))."""
+    # Replace rather than truncate, path may be a hardlink shared with another file
+    if os.path.lexists(path):
+        os.unlink(path)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def _format_parameter(param: Dict) -> str:
+    """Render a single parameter declaration, e.g. ``p_id IN NUMBER DEFAULT 0``."""
+    decl = param['name'] + ' ' + param['in_out'] + ' ' + param['data_type']
+    default = param.get('default')
+    return decl + ' DEFAULT ' + default if default else decl
+
 
 class PackageGenerator(OracleObjectGenerator):
     """Generates PL/SQL package specifications and bodies."""
@@ -31,12 +84,17 @@ class PackageGenerator(OracleObjectGenerator):
             tables: List of TableInfo objects
             num_packages: Number of packages to generate
             **kwargs: Additional parameters
+                schemas: Schema names to pick package owners from (default ['HR', 'FINANCE'])
+                output_dir: Directory to also write each package spec and body to as files
+                write_workers: Number of threads writing those files (default lets the pool decide)
             
         Returns:
             List of OracleObject instances
         """
         schemas = kwargs.get('schemas', ['HR', 'FINANCE'])
         output_dir = kwargs.get('output_dir')
+        write_workers = kwargs.get('write_workers')
+        pending_files: List[Tuple[str, str]] = []
         
         for i in range(num_packages):
             schema = random.choice(schemas) if schemas else None
@@ -64,17 +122,57 @@ class PackageGenerator(OracleObjectGenerator):
                 spec_file = os.path.join(output_dir, f"{package_name}_spec.sql")
                 body_file = os.path.join(output_dir, f"{package_name}_body.sql")
                 
-                with open(spec_file, 'w', encoding='utf-8') as f:
-                    f.write(package_spec)
-                    
-                with open(body_file, 'w', encoding='utf-8') as f:
-                    f.write(package_body)
-                    
-                logger.info(f"Package spec saved to {spec_file}")
-                logger.info(f"Package body saved to {body_file}")
+                pending_files.append((spec_file, package_spec))
+                pending_files.append((body_file, package_body))
+        
+        # Write all package files in parallel once generation is complete
+        if pending_files:
+            self._write_files(pending_files, write_workers)
+            for path, _ in pending_files:
+                logger.info(f"Package file saved to {path}")
         
         return self.objects
     
+    def _write_files(self, files: List[Tuple[str, str]], max_workers: Optional[int] = None) -> None:
+        """
+        Write files concurrently, hardlinking any file whose bytes were already written by this call.
+        
+        Args:
+            files: List of (path, content) pairs; content is encoded as UTF-8.
+                When a path is listed more than once, its last content wins.
+            max_workers: Thread pool size (None lets the executor decide)
+        """
+        # Content digest -> path of the first file written with those bytes. Kept
+        # per call, so links never reach files of an earlier generate() or another
+        # output_dir, and unique paths mean no entry can point at overwritten bytes.
+        written: Dict[bytes, str] = {}
+        writes = []
+        links = []
+        for path, content in dict(files).items():
+            data = content.encode('utf-8')
+            digest = hashlib.blake2b(data, digest_size=16).digest()
+            existing = written.get(digest)
+            if existing is not None:
+                links.append((existing, path, data))
+            else:
+                written[digest] = path
+                writes.append((path, data))
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(_write_bytes, path, data) for path, data in writes]
+            for future in futures:
+                future.result()
+        
+        # Link targets exist now that every write has completed
+        for existing, path, data in links:
+            try:
+                if os.path.lexists(path):
+                    os.remove(path)
+                os.link(existing, path)
+            except OSError:
+                # Filesystem without hardlink support - fall back to a plain write
+                _write_bytes(path, data)
+    
     def _generate_package(self, package_name: str, tables: List[TableInfo], schema: Optional[str] = None) -> Tuple[str, str]:
         """
         Generate a package specification and body.
@@ -123,15 +221,7 @@ class PackageGenerator(OracleObjectGenerator):
             ],
             'return_type': 'VARCHAR2',
             'description': 'Format a date using specified format',
-            'body': '''
-    IS
-        v_result VARCHAR2(100);
-    BEGIN
-        RETURN TO_CHAR(p_date, p_format);
-    EXCEPTION
-        WHEN OTHERS THEN
-            RETURN NULL;
-    END;'''
+            'body': _FORMATTED_DATE_BODY
         })
         
         functions.append({
@@ -141,14 +231,7 @@ class PackageGenerator(OracleObjectGenerator):
             ],
             'return_type': 'BOOLEAN',
             'description': 'Check if a string contains only numeric characters',
-            'body': '''
-    IS
-    BEGIN
-        RETURN REGEXP_LIKE(p_string, '^[0-9]+$');
-    EXCEPTION
-        WHEN OTHERS THEN
-            RETURN FALSE;
-    END;'''
+            'body': _IS_NUMERIC_BODY
         })
         
         # Generate table-specific functions/procedures
@@ -176,11 +259,7 @@ class PackageGenerator(OracleObjectGenerator):
         FROM {table_name}
         WHERE {pk_col} = p_{pk_col.lower()};
         
-        RETURN (v_count > 0);
-    EXCEPTION
-        WHEN OTHERS THEN
-            RETURN FALSE;
-    END;'''
+        RETURN (v_count > 0);''' + _RETURN_FALSE_ON_ERROR
             })
             
             # Generate validate_[table] procedure
@@ -288,17 +367,13 @@ class PackageGenerator(OracleObjectGenerator):
         lines.insert(3, "")
         
         # Add constants
-        lines.append("    -- Constants")
-        lines.append("    C_MAX_ATTEMPTS CONSTANT INTEGER := 3;")
-        lines.append("    C_DEFAULT_PAGE_SIZE CONSTANT INTEGER := 25;")
-        lines.append("")
+        lines.append(_CONSTANTS_BLOCK)
         
         # Add function declarations
         if functions:
             lines.append("    -- Functions")
             for func in functions:
-                params = ', '.join([f"{p['name']} {p['in_out']} {p['data_type']}{' DEFAULT ' + p['default'] if 'default' in p else ''}" 
-                                    for p in func['parameters']])
+                params = ', '.join(map(_format_parameter, func['parameters']))
                 lines.append(f"    -- {func.get('description', 'Function')}")
                 lines.append(f"    FUNCTION {func['name']}({params}) RETURN {func['return_type']};")
                 lines.append("")
@@ -307,8 +382,7 @@ class PackageGenerator(OracleObjectGenerator):
         if procedures:
             lines.append("    -- Procedures")
             for proc in procedures:
-                params = ', '.join([f"{p['name']} {p['in_out']} {p['data_type']}{' DEFAULT ' + p['default'] if 'default' in p else ''}"
-                                    for p in proc['parameters']])
+                params = ', '.join(map(_format_parameter, proc['parameters']))
                 lines.append(f"    -- {proc.get('description', 'Procedure')}")
                 lines.append(f"    PROCEDURE {proc['name']}({params});")
                 lines.append("")
@@ -341,8 +415,7 @@ class PackageGenerator(OracleObjectGenerator):
         # Add function implementations
         if functions:
             for func in functions:
-                params = ', '.join([f"{p['name']} {p['in_out']} {p['data_type']}{' DEFAULT ' + p['default'] if 'default' in p else ''}" 
-                                    for p in func['parameters']])
+                params = ', '.join(map(_format_parameter, func['parameters']))
                 
                 lines.append(f"    -- {func.get('description', 'Function')}")
                 lines.append(f"    FUNCTION {func['name']}({params}) RETURN {func['return_type']}")
@@ -352,8 +425,7 @@ class PackageGenerator(OracleObjectGenerator):
         # Add procedure implementations
         if procedures:
             for proc in procedures:
-                params = ', '.join([f"{p['name']} {p['in_out']} {p['data_type']}{' DEFAULT ' + p['default'] if 'default' in p else ''}"
-                                    for p in proc['parameters']])
+                params = ', '.join(map(_format_parameter, proc['parameters']))
                 
                 lines.append(f"    -- {proc.get('description', 'Procedure')}")
                 lines.append(f"    PROCEDURE {proc['name']}({params})")
@@ -9,121 +9,283 @@ stored procedures for common database operations and business logic.
 Author: John Clark Naldoza
 """
 
-from typing import List, Dict, Any
-from core import OracleObjectGenerator, OracleObject, TableInfo
+import re
+import sys
+import copy
+import random
+import string
+import functools
+import textwrap
+from typing import List, Dict, Any, Callable, Iterable, Iterator, Tuple, NamedTuple, Optional, Sequence, Union
+from core import OracleObjectGenerator, OracleObject, TableInfo, join_sql_script
 
-class ProcedureGenerator(OracleObjectGenerator):
+# Existence checks shared by the CRUD procedures. Both stop at the first
+# matching row; the outcome is read from NO_DATA_FOUND instead of a COUNT(*).
+_EXISTS_CHECK_TMPL = string.Template("""BEGIN
+  SELECT 1 INTO $var
+  FROM $table
+  WHERE $condition
+    AND ROWNUM = 1;
+EXCEPTION
+  WHEN NO_DATA_FOUND THEN
+    RAISE_APPLICATION_ERROR($code, $message);
+END;""")
+
+_NOT_EXISTS_CHECK_TMPL = string.Template("""BEGIN
+  SELECT 1 INTO $var
+  FROM $table
+  WHERE $condition
+    AND ROWNUM = 1;
+  
+  RAISE_APPLICATION_ERROR($code, $message);
+EXCEPTION
+  WHEN NO_DATA_FOUND THEN
+    NULL;
+END;""")
+
+# Standard exception handler closing the CRUD procedures
+_ROLLBACK_FOOTER_TMPL = string.Template("""EXCEPTION
+  WHEN OTHERS THEN
+    -- Roll back any changes
+    ROLLBACK;
+    
+    -- Re-raise the error
+    RAISE;
+END $name;
+/""")
+
+
+class SchemaFeatures(NamedTuple):
     """
-    Generates Oracle stored procedure objects
+    Optional schema capabilities the generated procedures are specialized for.
+    
+    Disabling a feature removes its parameters, columns and checks from the
+    emitted PL/SQL instead of leaving the branches to be evaluated per call.
     """
-    def __init__(self):
-        super().__init__()
-        
-    def generate(self, tables: List[TableInfo], num_procedures: int = 3, **kwargs) -> List[OracleObject]:
-        """Generate Oracle procedures for tables and common operations"""
-        # Generate table-specific procedures
-        for table_info in tables:
-            table_name = table_info.name
-            
-            # Generate appropriate procedures based on table
-            if table_name == 'EMPLOYEES':
-                self._generate_employee_procedures(table_info)
-            elif table_name == 'DEPARTMENTS':
-                self._generate_department_procedures(table_info)
-            elif table_name == 'ORDERS':
-                self._generate_order_procedures(table_info)
-        
-        # Generate utility procedures
-        self._generate_utility_procedures()
-        
-        # Generate data validation procedures
-        self._generate_validation_procedures()
-        
-        return self.objects
-        
-    def _generate_department_procedures(self, table_info: TableInfo) -> None:
-        """Generate procedures for the DEPARTMENTS table"""
-        # Procedure to create a new department
-        create_dept_proc = OracleObject("CREATE_DEPARTMENT", "PROCEDURE")
-        create_dept_proc.sql = """-- Procedure to create a new department
+    jp_columns: bool = True
+    managers: bool = True
+    salespeople: bool = True
+
+
+def _has_jp_columns(table_info: TableInfo) -> bool:
+    """Check whether a table carries any Japanese (*_JP) columns"""
+    return any(col.name.upper().endswith('_JP') for col in table_info.columns)
+
+
+# Lines ending in "-- [feature]" are only emitted when that feature is enabled
+_FEATURE_TAG = re.compile(r"\s*-- \[(\w+)\]$")
+
+
+@functools.lru_cache(maxsize=None)
+def _specialize(sql: str, features: SchemaFeatures) -> str:
+    """
+    Drop the lines tagged for disabled features and strip the remaining tags.
+    
+    A trailing comma left in front of a closing parenthesis by a dropped
+    list item is removed as well, and so is a blank line that would double
+    up with the one before a dropped block.
+    """
+    enabled = features._asdict()
+    lines: List[str] = []
+    dropped = False
+    for line in sql.split("\n"):
+        tag = _FEATURE_TAG.search(line)
+        if tag:
+            if not enabled[tag.group(1)]:
+                dropped = True
+                continue
+            line = line[:tag.start()]
+        if dropped and not line.strip() and lines and not lines[-1].strip():
+            continue
+        dropped = False
+        if line.lstrip().startswith(")") and lines and lines[-1].endswith(","):
+            lines[-1] = lines[-1][:-1]
+        lines.append(line)
+    return "\n".join(lines)
+
+
+# textwrap.dedent memoized per unique fragment
+_D = functools.lru_cache(maxsize=None)(textwrap.dedent)
+
+
+class _ExistsCheck(NamedTuple):
+    """Declarative description of a single existence check"""
+    comment: str
+    var: str
+    table: str
+    condition: str
+    must_exist: bool
+    code: int
+    message: str
+    guard: Optional[str] = None
+    feature: Optional[str] = None
+
+
+@functools.lru_cache(maxsize=None)
+def _render_check(check: _ExistsCheck) -> str:
+    """Render an existence check as an indented PL/SQL fragment"""
+    template = _EXISTS_CHECK_TMPL if check.must_exist else _NOT_EXISTS_CHECK_TMPL
+    sql = template.substitute(check._asdict())
+    if check.guard:
+        sql = f"IF {check.guard} THEN\n{textwrap.indent(sql, '  ')}\nEND IF;"
+    sql = textwrap.indent(f"-- {check.comment}\n{sql}", '  ') + "\n"
+    if check.feature:
+        sql = "\n".join(f"{line} -- [{check.feature}]" for line in sql.split("\n"))
+    return sql
+
+
+def _compose_proc(header: str, checks: Sequence[Union[_ExistsCheck, str]], body: str, footer: str) -> str:
+    """
+    Assemble a procedure from its header, validation checks, body and footer.
+    
+    Checks may be _ExistsCheck tuples or hand-written PL/SQL fragments; the
+    fragments are dedented and re-indented to the procedure body level.
+    """
+    fragments = [header]
+    fragments.extend(textwrap.indent(_D(check), '  ') if isinstance(check, str) else _render_check(check)
+                     for check in checks)
+    fragments.append(body)
+    fragments.append(footer)
+    return "\n".join(fragments)
+
+
+# Name pools for the employee block of GENERATE_TEST_DATA
+_EMPLOYEE_FIRST_NAMES = ('John', 'Jane', 'Michael', 'Emily', 'David', 'Sarah', 'Robert', 'Lisa',
+                         'William', 'Mary', 'James', 'Patricia', 'Thomas', 'Jennifer', 'Charles', 'Linda')
+_EMPLOYEE_LAST_NAMES = ('Smith', 'Johnson', 'Williams', 'Jones', 'Brown', 'Davis', 'Miller', 'Wilson',
+                        'Moore', 'Taylor', 'Anderson', 'Thomas', 'Jackson', 'White', 'Harris', 'Martin')
+_EMPLOYEE_DOMAINS = ('example.com', 'testmail.org', 'fakecorp.net', 'mailtest.co')
+_EMPLOYEE_JOB_IDS = ('IT_PROG', 'SA_REP', 'ST_CLERK', 'AD_ASST', 'MK_REP', 'HR_REP', 'PR_REP', 'AC_MGR')
+
+# Value pools for the customer and order blocks of GENERATE_TEST_DATA
+_CUSTOMER_FIRST_NAMES = ('James', 'Mary', 'John', 'Patricia', 'Robert', 'Jennifer', 'Michael', 'Linda',
+                         'William', 'Elizabeth', 'David', 'Barbara', 'Richard', 'Susan', 'Joseph', 'Jessica')
+_CUSTOMER_LAST_NAMES = ('Smith', 'Johnson', 'Williams', 'Brown', 'Jones', 'Garcia', 'Miller', 'Davis',
+                        'Rodriguez', 'Martinez', 'Hernandez', 'Lopez', 'Gonzalez', 'Wilson', 'Anderson', 'Thomas')
+_CUSTOMER_DOMAINS = ('gmail.com', 'yahoo.com', 'hotmail.com', 'aol.com', 'outlook.com', 'icloud.com',
+                     'protonmail.com')
+_CUSTOMER_CITIES = ('New York', 'Los Angeles', 'Chicago', 'Houston', 'Phoenix', 'Philadelphia', 'San Antonio',
+                    'San Diego', 'Dallas', 'San Jose', 'Austin', 'Jacksonville', 'Fort Worth', 'Columbus',
+                    'Charlotte')
+_CUSTOMER_STATES = ('NY', 'CA', 'IL', 'TX', 'AZ', 'PA', 'TX', 'CA', 'TX', 'CA', 'TX', 'FL', 'TX', 'OH', 'NC')
+_CUSTOMER_STREETS = ('Main', 'Oak', 'Pine', 'Maple', 'Cedar')
+_CUSTOMER_STREET_SUFFIXES = ('St', 'Ave', 'Rd', 'Blvd')
+_ORDER_PAYMENT_METHODS = ('CREDIT', 'DEBIT', 'BANK_TRANSFER', 'PAYPAL', 'CASH')
+_ORDER_STATUSES = ('PENDING', 'PROCESSING', 'SHIPPED', 'DELIVERED', 'COMPLETED', 'CANCELLED', 'RETURNED',
+                   'REFUNDED')
+
+
+def _sql_literal(value: str) -> str:
+    """Quote a Python string as a PL/SQL string literal"""
+    return "'" + value.replace("'", "''") + "'"
+
+
+def _collection_literal(type_name: str, values: Sequence[str]) -> str:
+    """Render values as a PL/SQL collection constructor, e.g. name_array('A', 'B')"""
+    return f"{type_name}({', '.join(_sql_literal(value) for value in values)})"
+
+
+def _pool_join(alias: str, values: Sequence[str], index_column: str) -> str:
+    """Render a JOIN that looks up a value pool by the 1-based position in r.index_column"""
+    return (f"      JOIN (SELECT ROWNUM AS idx, COLUMN_VALUE AS val "
+            f"FROM TABLE({_collection_literal('SYS.ODCIVARCHAR2LIST', values)})) {alias}\n"
+            f"        ON {alias}.idx = r.{index_column}")
+
+
+def _number_collection_literal(type_name: str, values: Sequence[int]) -> str:
+    """Render integers as a PL/SQL collection constructor, e.g. index_tab_t(3, 1)"""
+    return f"{type_name}({', '.join(str(value) for value in values)})"
+
+
+# Seed for the random picks baked into GENERATE_TEST_DATA
+_TEST_DATA_SEED = 42
+
+
+def _employee_random_picks(seed: int) -> Dict[str, str]:
+    """
+    Precompute the random values consumed by the employee block of GENERATE_TEST_DATA.
+    
+    Each list has a distinct prime length and is cycled with MOD at run time,
+    starting after the employees that already exist, so a combination of picks
+    only repeats after the product of the lengths.
+    """
+    rng = random.Random(seed)
+    
+    def indexes(pool: Sequence[str], count: int) -> str:
+        return _number_collection_literal("index_tab_t", [rng.randrange(len(pool)) + 1 for _ in range(count)])
+    
+    return {
+        'employee_first_name_idx': indexes(_EMPLOYEE_FIRST_NAMES, 17),
+        'employee_last_name_idx': indexes(_EMPLOYEE_LAST_NAMES, 19),
+        'employee_domain_idx': indexes(_EMPLOYEE_DOMAINS, 23),
+        'employee_job_idx': indexes(_EMPLOYEE_JOB_IDS, 29),
+        'employee_dept_ids': _number_collection_literal(
+            "index_tab_t", [rng.randrange(1, 11) * 10 for _ in range(31)]),
+        'employee_salaries': _number_collection_literal(
+            "index_tab_t", [rng.randrange(3000, 15000) for _ in range(37)]),
+        # Days after 2015-01-01, capped at ten years so hire dates stay in the past
+        'employee_hire_offsets': _number_collection_literal(
+            "index_tab_t", [rng.randrange(0, 3650) for _ in range(41)]),
+        'employee_phone_numbers': _collection_literal(
+            "name_array", [f"555-{rng.randrange(100, 1000):03d}-{rng.randrange(1000, 10000):04d}"
+                           for _ in range(43)]),
+    }
+
+
+# SQL bodies for the generated procedures. None of them depend on generator
+# input, so they are built once at import time and shared by every call.
+
+_CREATE_DEPARTMENT_SQL = _compose_proc(
+    """-- Procedure to create a new department
 CREATE OR REPLACE PROCEDURE CREATE_DEPARTMENT(
   p_department_name IN VARCHAR2,
-  p_department_name_jp IN VARCHAR2 DEFAULT NULL,
-  p_manager_id IN NUMBER DEFAULT NULL,
+  p_department_name_jp IN VARCHAR2 DEFAULT NULL, -- [jp_columns]
+  p_manager_id IN NUMBER DEFAULT NULL, -- [managers]
   p_location_id IN NUMBER,
   p_department_id OUT NUMBER
 )
 IS
   l_dept_exists NUMBER;
-  l_manager_exists NUMBER := 1;  -- Default if no manager specified
+  l_manager_exists NUMBER; -- [managers]
   l_location_exists NUMBER;
 BEGIN
-  -- Input validation
-  -- Check if department name already exists
-  SELECT COUNT(*) INTO l_dept_exists
-  FROM DEPARTMENTS
-  WHERE UPPER(DEPARTMENT_NAME) = UPPER(p_department_name);
-  
-  IF l_dept_exists > 0 THEN
-    RAISE_APPLICATION_ERROR(-20001, 'Department name already exists');
-  END IF;
-  
-  -- Check if location exists
-  SELECT COUNT(*) INTO l_location_exists
-  FROM LOCATIONS
-  WHERE LOCATION_ID = p_location_id;
-  
-  IF l_location_exists = 0 THEN
-    RAISE_APPLICATION_ERROR(-20002, 'Location ID does not exist');
-  END IF;
-  
-  -- Check if manager exists (if provided)
-  IF p_manager_id IS NOT NULL THEN
-    SELECT COUNT(*) INTO l_manager_exists
-    FROM EMPLOYEES
-    WHERE EMPLOYEE_ID = p_manager_id;
-    
-    IF l_manager_exists = 0 THEN
-      RAISE_APPLICATION_ERROR(-20003, 'Manager ID does not exist');
-    END IF;
-  END IF;
-  
-  -- Insert the new department
+  -- Input validation""",
+    (
+        _ExistsCheck("Check if department name already exists", "l_dept_exists", "DEPARTMENTS",
+                     "DEPARTMENT_NAME = INITCAP(TRIM(p_department_name))", False,
+                     -20001, "'Department name already exists'"),
+        _ExistsCheck("Check if location exists", "l_location_exists", "LOCATIONS",
+                     "LOCATION_ID = p_location_id", True,
+                     -20002, "'Location ID does not exist'"),
+        _ExistsCheck("Check if manager exists (if provided)", "l_manager_exists", "EMPLOYEES",
+                     "EMPLOYEE_ID = p_manager_id", True,
+                     -20003, "'Manager ID does not exist'", guard="p_manager_id IS NOT NULL",
+                     feature="managers"),
+    ),
+    """  -- Insert the new department
   INSERT INTO DEPARTMENTS (
     DEPARTMENT_ID,
     DEPARTMENT_NAME,
-    DEPARTMENT_NAME_JP,
-    MANAGER_ID,
+    DEPARTMENT_NAME_JP, -- [jp_columns]
+    MANAGER_ID, -- [managers]
     LOCATION_ID
   ) VALUES (
     DEPARTMENTS_SEQ.NEXTVAL,
-    p_department_name,
-    p_department_name_jp,
-    p_manager_id,
+    INITCAP(TRIM(p_department_name)),
+    p_department_name_jp, -- [jp_columns]
+    p_manager_id, -- [managers]
     p_location_id
   ) RETURNING DEPARTMENT_ID INTO p_department_id;
   
   COMMIT;
   
   DBMS_OUTPUT.PUT_LINE('New department created: ' || p_department_name || 
-                      ' (ID: ' || p_department_id || ')');
-EXCEPTION
-  WHEN OTHERS THEN
-    -- Roll back any changes
-    ROLLBACK;
-    
-    -- Re-raise the error
-    RAISE;
-END CREATE_DEPARTMENT;
-/"""
-        create_dept_proc.add_dependency("DEPARTMENTS")
-        create_dept_proc.add_dependency("LOCATIONS")
-        create_dept_proc.add_dependency("EMPLOYEES")
-        self.objects.append(create_dept_proc)
-        
-        # Procedure to relocate a department
-        relocate_proc = OracleObject("RELOCATE_DEPARTMENT", "PROCEDURE")
-        relocate_proc.sql = """-- Procedure to relocate a department
+                      ' (ID: ' || p_department_id || ')');""",
+    _ROLLBACK_FOOTER_TMPL.substitute(name="CREATE_DEPARTMENT"),
+)
+
+
+_RELOCATE_DEPARTMENT_SQL = """-- Procedure to relocate a department
 CREATE OR REPLACE PROCEDURE RELOCATE_DEPARTMENT(
   p_department_id IN NUMBER,
   p_new_location_id IN NUMBER,
@@ -131,24 +293,23 @@ CREATE OR REPLACE PROCEDURE RELOCATE_DEPARTMENT(
   p_notify_employees IN BOOLEAN DEFAULT TRUE
 )
 IS
-  l_dept_exists NUMBER;
-  l_location_exists NUMBER;
-  l_dept_name VARCHAR2(30);
+  l_dept_name DEPARTMENTS.DEPARTMENT_NAME%TYPE;
   l_old_location_id NUMBER;
-  l_old_location_city VARCHAR2(30);
-  l_new_location_city VARCHAR2(30);
+  l_old_location_city LOCATIONS.CITY%TYPE;
+  l_new_location_city LOCATIONS.CITY%TYPE;
   l_employee_count NUMBER;
 BEGIN
   -- Input validation
   -- Check if department exists
-  SELECT COUNT(*), DEPARTMENT_NAME, LOCATION_ID
-  INTO l_dept_exists, l_dept_name, l_old_location_id
-  FROM DEPARTMENTS
-  WHERE DEPARTMENT_ID = p_department_id;
-  
-  IF l_dept_exists = 0 THEN
-    RAISE_APPLICATION_ERROR(-20001, 'Department ID does not exist');
-  END IF;
+  BEGIN
+    SELECT DEPARTMENT_NAME, LOCATION_ID
+    INTO l_dept_name, l_old_location_id
+    FROM DEPARTMENTS
+    WHERE DEPARTMENT_ID = p_department_id;
+  EXCEPTION
+    WHEN NO_DATA_FOUND THEN
+      RAISE_APPLICATION_ERROR(-20001, 'Department ID does not exist');
+  END;
   
   -- No change needed if same location
   IF l_old_location_id = p_new_location_id THEN
@@ -156,14 +317,15 @@ BEGIN
   END IF;
   
   -- Check if new location exists
-  SELECT COUNT(*), CITY
-  INTO l_location_exists, l_new_location_city
-  FROM LOCATIONS
-  WHERE LOCATION_ID = p_new_location_id;
-  
-  IF l_location_exists = 0 THEN
-    RAISE_APPLICATION_ERROR(-20003, 'Location ID does not exist');
-  END IF;
+  BEGIN
+    SELECT CITY
+    INTO l_new_location_city
+    FROM LOCATIONS
+    WHERE LOCATION_ID = p_new_location_id;
+  EXCEPTION
+    WHEN NO_DATA_FOUND THEN
+      RAISE_APPLICATION_ERROR(-20003, 'Location ID does not exist');
+  END;
   
   -- Get old location city
   SELECT CITY INTO l_old_location_city
@@ -211,28 +373,22 @@ EXCEPTION
     RAISE;
 END RELOCATE_DEPARTMENT;
 /"""
-        relocate_proc.add_dependency("DEPARTMENTS")
-        relocate_proc.add_dependency("LOCATIONS")
-        relocate_proc.add_dependency("EMPLOYEES")
-        self.objects.append(relocate_proc)
-    
-    def _generate_employee_procedures(self, table_info: TableInfo) -> None:
-        """Generate procedures for the EMPLOYEES table"""
-        # Procedure to hire a new employee
-        hire_proc = OracleObject("HIRE_EMPLOYEE", "PROCEDURE")
-        hire_proc.sql = """-- Procedure to hire a new employee
+
+
+_HIRE_EMPLOYEE_SQL = _compose_proc(
+    """-- Procedure to hire a new employee
 CREATE OR REPLACE PROCEDURE HIRE_EMPLOYEE(
   p_first_name IN VARCHAR2,
   p_last_name IN VARCHAR2,
-  p_first_name_jp IN VARCHAR2 DEFAULT NULL,
-  p_last_name_jp IN VARCHAR2 DEFAULT NULL,
+  p_first_name_jp IN VARCHAR2 DEFAULT NULL, -- [jp_columns]
+  p_last_name_jp IN VARCHAR2 DEFAULT NULL, -- [jp_columns]
   p_email IN VARCHAR2,
   p_phone IN VARCHAR2,
   p_hire_date IN DATE DEFAULT SYSDATE,
   p_job_id IN VARCHAR2,
   p_salary IN NUMBER,
   p_commission_pct IN NUMBER DEFAULT NULL,
-  p_manager_id IN NUMBER DEFAULT NULL,
+  p_manager_id IN NUMBER DEFAULT NULL, -- [managers]
   p_department_id IN NUMBER,
   p_employee_id OUT NUMBER
 )
@@ -240,35 +396,36 @@ IS
   l_email_count NUMBER;
   l_dept_exists NUMBER;
   l_job_exists NUMBER;
-  l_manager_exists NUMBER := 0;
+  l_manager_exists NUMBER; -- [managers]
   l_min_salary NUMBER;
   l_max_salary NUMBER;
 BEGIN
-  -- Input validation
-  -- Check if email already exists
-  SELECT COUNT(*) INTO l_email_count
-  FROM EMPLOYEES
-  WHERE UPPER(EMAIL) = UPPER(p_email);
+  -- Input validation""",
+    (
+        """  -- Look up all validation flags in a single query
+  SELECT (SELECT COUNT(*) FROM EMPLOYEES WHERE EMAIL = LOWER(TRIM(p_email)) AND ROWNUM = 1),
+         (SELECT COUNT(*) FROM DEPARTMENTS WHERE DEPARTMENT_ID = p_department_id),
+         (SELECT COUNT(*) FROM EMPLOYEES WHERE EMPLOYEE_ID = p_manager_id), -- [managers]
+         NVL2(j.JOB_ID, 1, 0),
+         j.MIN_SALARY,
+         j.MAX_SALARY
+  INTO l_email_count,
+       l_dept_exists,
+       l_manager_exists, -- [managers]
+       l_job_exists,
+       l_min_salary,
+       l_max_salary
+  FROM DUAL
+  LEFT JOIN JOBS j ON j.JOB_ID = p_job_id;
   
   IF l_email_count > 0 THEN
     RAISE_APPLICATION_ERROR(-20001, 'Email address already exists');
   END IF;
   
-  -- Check if department exists
-  SELECT COUNT(*) INTO l_dept_exists
-  FROM DEPARTMENTS
-  WHERE DEPARTMENT_ID = p_department_id;
-  
   IF l_dept_exists = 0 THEN
     RAISE_APPLICATION_ERROR(-20002, 'Department ID does not exist');
   END IF;
   
-  -- Check if job exists and salary is within range
-  SELECT COUNT(*), MIN_SALARY, MAX_SALARY 
-  INTO l_job_exists, l_min_salary, l_max_salary
-  FROM JOBS
-  WHERE JOB_ID = p_job_id;
-  
   IF l_job_exists = 0 THEN
     RAISE_APPLICATION_ERROR(-20003, 'Job ID does not exist');
   END IF;
@@ -279,45 +436,39 @@ BEGIN
       l_min_salary || ' - ' || l_max_salary || ')');
   END IF;
   
-  -- Check if manager exists (if provided)
-  IF p_manager_id IS NOT NULL THEN
-    SELECT COUNT(*) INTO l_manager_exists
-    FROM EMPLOYEES
-    WHERE EMPLOYEE_ID = p_manager_id;
-    
-    IF l_manager_exists = 0 THEN
-      RAISE_APPLICATION_ERROR(-20005, 'Manager ID does not exist');
-    END IF;
-  END IF;
-  
-  -- Insert the new employee
+  IF p_manager_id IS NOT NULL AND l_manager_exists = 0 THEN -- [managers]
+    RAISE_APPLICATION_ERROR(-20005, 'Manager ID does not exist'); -- [managers]
+  END IF; -- [managers]
+""",
+    ),
+    """  -- Insert the new employee
   INSERT INTO EMPLOYEES (
     EMPLOYEE_ID,
     FIRST_NAME,
     LAST_NAME,
-    FIRST_NAME_JP,
-    LAST_NAME_JP,
+    FIRST_NAME_JP, -- [jp_columns]
+    LAST_NAME_JP, -- [jp_columns]
     EMAIL,
     PHONE_NUMBER,
     HIRE_DATE,
     JOB_ID,
     SALARY,
     COMMISSION_PCT,
-    MANAGER_ID,
+    MANAGER_ID, -- [managers]
     DEPARTMENT_ID
   ) VALUES (
     EMPLOYEES_SEQ.NEXTVAL,
     p_first_name,
     p_last_name,
-    p_first_name_jp,
-    p_last_name_jp,
-    UPPER(p_email),
+    p_first_name_jp, -- [jp_columns]
+    p_last_name_jp, -- [jp_columns]
+    LOWER(TRIM(p_email)),
     p_phone,
     p_hire_date,
     p_job_id,
     p_salary,
     p_commission_pct,
-    p_manager_id,
+    p_manager_id, -- [managers]
     p_department_id
   ) RETURNING EMPLOYEE_ID INTO p_employee_id;
   
@@ -325,83 +476,67 @@ BEGIN
   
   -- Log the hire
   DBMS_OUTPUT.PUT_LINE('New employee hired: ' || p_first_name || ' ' || p_last_name || 
-                      ' (ID: ' || p_employee_id || ') in department ' || p_department_id);
-EXCEPTION
-  WHEN OTHERS THEN
-    -- Roll back any changes
-    ROLLBACK;
-    
-    -- Re-raise the error
-    RAISE;
-END HIRE_EMPLOYEE;
-/"""
-        hire_proc.add_dependency("EMPLOYEES")
-        hire_proc.add_dependency("DEPARTMENTS")
-        hire_proc.add_dependency("JOBS")
-        self.objects.append(hire_proc)
-        
-        # Procedure to transfer an employee
-        transfer_proc = OracleObject("TRANSFER_EMPLOYEE", "PROCEDURE")
-        transfer_proc.sql = """-- Procedure to transfer an employee to a different department
+                      ' (ID: ' || p_employee_id || ') in department ' || p_department_id);""",
+    _ROLLBACK_FOOTER_TMPL.substitute(name="HIRE_EMPLOYEE"),
+)
+
+
+_TRANSFER_EMPLOYEE_SQL = _compose_proc(
+    """-- Procedure to transfer an employee to a different department
 CREATE OR REPLACE PROCEDURE TRANSFER_EMPLOYEE(
   p_employee_id IN NUMBER,
   p_new_department_id IN NUMBER,
   p_new_job_id IN VARCHAR2 DEFAULT NULL,
   p_new_salary IN NUMBER DEFAULT NULL,
-  p_new_manager_id IN NUMBER DEFAULT NULL,
+  p_new_manager_id IN NUMBER DEFAULT NULL, -- [managers]
   p_effective_date IN DATE DEFAULT SYSDATE,
   p_reason IN VARCHAR2 DEFAULT NULL
 )
 IS
-  l_emp_exists NUMBER;
   l_dept_exists NUMBER;
-  l_job_exists NUMBER := 1;  -- Default if no job change
-  l_manager_exists NUMBER := 1;  -- Default if no manager change
+  l_manager_exists NUMBER; -- [managers]
   l_old_dept_id NUMBER;
-  l_old_job_id VARCHAR2(10);
+  l_old_job_id EMPLOYEES.JOB_ID%TYPE;
   l_old_salary NUMBER;
   l_old_manager_id NUMBER;
   l_min_salary NUMBER;
   l_max_salary NUMBER;
 BEGIN
-  -- Input validation
-  -- Check if employee exists
-  SELECT COUNT(*), DEPARTMENT_ID, JOB_ID, SALARY, MANAGER_ID
-  INTO l_emp_exists, l_old_dept_id, l_old_job_id, l_old_salary, l_old_manager_id
-  FROM EMPLOYEES
-  WHERE EMPLOYEE_ID = p_employee_id;
-  
-  IF l_emp_exists = 0 THEN
-    RAISE_APPLICATION_ERROR(-20001, 'Employee ID ' || p_employee_id || ' does not exist');
-  END IF;
+  -- Input validation""",
+    (
+        """  -- Check if employee exists
+  BEGIN
+    SELECT DEPARTMENT_ID, JOB_ID, SALARY, MANAGER_ID
+    INTO l_old_dept_id, l_old_job_id, l_old_salary, l_old_manager_id
+    FROM EMPLOYEES
+    WHERE EMPLOYEE_ID = p_employee_id;
+  EXCEPTION
+    WHEN NO_DATA_FOUND THEN
+      RAISE_APPLICATION_ERROR(-20001, 'Employee ID ' || p_employee_id || ' does not exist');
+  END;
   
   -- If trying to transfer to the same department with no other changes
   IF p_new_department_id = l_old_dept_id 
-     AND p_new_job_id IS NULL 
-     AND p_new_salary IS NULL 
-     AND p_new_manager_id IS NULL THEN
+     AND p_new_job_id IS NULL
+     AND p_new_manager_id IS NULL -- [managers]
+     AND p_new_salary IS NULL THEN
     RAISE_APPLICATION_ERROR(-20002, 'No changes specified for transfer');
   END IF;
-  
-  -- Check if department exists
-  SELECT COUNT(*) INTO l_dept_exists
-  FROM DEPARTMENTS
-  WHERE DEPARTMENT_ID = p_new_department_id;
-  
-  IF l_dept_exists = 0 THEN
-    RAISE_APPLICATION_ERROR(-20003, 'Department ID ' || p_new_department_id || ' does not exist');
-  END IF;
-  
-  -- Check if job exists and salary is within range (if job is changing)
+""",
+        _ExistsCheck("Check if department exists", "l_dept_exists", "DEPARTMENTS",
+                     "DEPARTMENT_ID = p_new_department_id", True,
+                     -20003, "'Department ID ' || p_new_department_id || ' does not exist'"),
+        """  -- Check if job exists and salary is within range (if job is changing)
   IF p_new_job_id IS NOT NULL THEN
-    SELECT COUNT(*), MIN_SALARY, MAX_SALARY 
-    INTO l_job_exists, l_min_salary, l_max_salary
-    FROM JOBS
-    WHERE JOB_ID = p_new_job_id;
-    
-    IF l_job_exists = 0 THEN
-      RAISE_APPLICATION_ERROR(-20004, 'Job ID ' || p_new_job_id || ' does not exist');
-    END IF;
+    BEGIN
+      SELECT MIN_SALARY, MAX_SALARY
+      INTO l_min_salary, l_max_salary
+      FROM JOBS
+      WHERE JOB_ID = p_new_job_id;
+    EXCEPTION
+      WHEN NO_DATA_FOUND THEN
+        RAISE_APPLICATION_ERROR(-20004, 'Job ID ' || p_new_job_id || ' does not exist');
+    END;
     
     -- Validate new salary if provided, otherwise use existing salary
     IF p_new_salary IS NOT NULL THEN
@@ -412,24 +547,18 @@ BEGIN
       END IF;
     END IF;
   END IF;
-  
-  -- Check if manager exists (if provided)
-  IF p_new_manager_id IS NOT NULL THEN
-    -- Prevent circular management (employee can't be their own manager)
-    IF p_new_manager_id = p_employee_id THEN
-      RAISE_APPLICATION_ERROR(-20006, 'An employee cannot be their own manager');
-    END IF;
-    
-    SELECT COUNT(*) INTO l_manager_exists
-    FROM EMPLOYEES
-    WHERE EMPLOYEE_ID = p_new_manager_id;
-    
-    IF l_manager_exists = 0 THEN
-      RAISE_APPLICATION_ERROR(-20007, 'Manager ID ' || p_new_manager_id || ' does not exist');
-    END IF;
-  END IF;
-  
-  -- Create a record of the transfer (in a real system, this would go to a history table)
+""",
+        """  -- Prevent circular management (employee can't be their own manager) -- [managers]
+  IF p_new_manager_id = p_employee_id THEN -- [managers]
+    RAISE_APPLICATION_ERROR(-20006, 'An employee cannot be their own manager'); -- [managers]
+  END IF; -- [managers]
+""",
+        _ExistsCheck("Check if manager exists (if provided)", "l_manager_exists", "EMPLOYEES",
+                     "EMPLOYEE_ID = p_new_manager_id", True,
+                     -20007, "'Manager ID ' || p_new_manager_id || ' does not exist'",
+                     guard="p_new_manager_id IS NOT NULL", feature="managers"),
+    ),
+    """  -- Create a record of the transfer (in a real system, this would go to a history table)
   DBMS_OUTPUT.PUT_LINE('TRANSFER RECORD: Employee ' || p_employee_id || 
                        ' transferred from department ' || l_old_dept_id || 
                        ' to department ' || p_new_department_id ||
@@ -440,131 +569,94 @@ BEGIN
   UPDATE EMPLOYEES
   SET DEPARTMENT_ID = p_new_department_id,
       JOB_ID = NVL(p_new_job_id, JOB_ID),
-      SALARY = NVL(p_new_salary, SALARY),
-      MANAGER_ID = NVL(p_new_manager_id, MANAGER_ID)
+      MANAGER_ID = NVL(p_new_manager_id, MANAGER_ID), -- [managers]
+      SALARY = NVL(p_new_salary, SALARY)
   WHERE EMPLOYEE_ID = p_employee_id;
   
   COMMIT;
   
-  DBMS_OUTPUT.PUT_LINE('Employee ' || p_employee_id || ' successfully transferred');
-EXCEPTION
-  WHEN OTHERS THEN
-    -- Roll back any changes
-    ROLLBACK;
-    
-    -- Re-raise the error
-    RAISE;
-END TRANSFER_EMPLOYEE;
-/"""
-        transfer_proc.add_dependency("EMPLOYEES")
-        transfer_proc.add_dependency("DEPARTMENTS")
-        transfer_proc.add_dependency("JOBS")
-        self.objects.append(transfer_proc)
-        
-    def _generate_order_procedures(self, table_info: TableInfo) -> None:
-        """Generate procedures for the ORDERS table"""
-        # Procedure to create a new order
-        create_order_proc = OracleObject("CREATE_ORDER", "PROCEDURE")
-        create_order_proc.sql = """-- Procedure to create a new order
+  DBMS_OUTPUT.PUT_LINE('Employee ' || p_employee_id || ' successfully transferred');""",
+    _ROLLBACK_FOOTER_TMPL.substitute(name="TRANSFER_EMPLOYEE"),
+)
+
+
+_CREATE_ORDER_SQL = _compose_proc(
+    """-- Procedure to create a new order
 CREATE OR REPLACE PROCEDURE CREATE_ORDER(
   p_customer_id IN NUMBER,
-  p_salesperson_id IN NUMBER DEFAULT NULL,
+  p_salesperson_id IN NUMBER DEFAULT NULL, -- [salespeople]
   p_shipping_address IN VARCHAR2,
-  p_shipping_address_jp IN VARCHAR2 DEFAULT NULL,
+  p_shipping_address_jp IN VARCHAR2 DEFAULT NULL, -- [jp_columns]
   p_shipping_city IN VARCHAR2,
-  p_shipping_city_jp IN VARCHAR2 DEFAULT NULL,
+  p_shipping_city_jp IN VARCHAR2 DEFAULT NULL, -- [jp_columns]
   p_shipping_state IN VARCHAR2,
   p_shipping_zip IN VARCHAR2,
   p_shipping_country IN VARCHAR2 DEFAULT 'USA',
   p_payment_method IN VARCHAR2 DEFAULT 'CREDIT',
   p_notes IN CLOB DEFAULT NULL,
-  p_notes_jp IN CLOB DEFAULT NULL,
+  p_notes_jp IN CLOB DEFAULT NULL, -- [jp_columns]
   p_order_id OUT NUMBER
 )
 IS
   l_customer_exists NUMBER;
-  l_salesperson_exists NUMBER := 1;  -- Default if no salesperson
+  l_salesperson_exists NUMBER; -- [salespeople]
 BEGIN
-  -- Input validation
-  -- Check if customer exists
-  SELECT COUNT(*) INTO l_customer_exists
-  FROM CUSTOMERS
-  WHERE CUSTOMER_ID = p_customer_id;
-  
-  IF l_customer_exists = 0 THEN
-    RAISE_APPLICATION_ERROR(-20001, 'Customer ID does not exist');
-  END IF;
-  
-  -- Check if salesperson exists (if provided)
-  IF p_salesperson_id IS NOT NULL THEN
-    SELECT COUNT(*) INTO l_salesperson_exists
-    FROM EMPLOYEES
-    WHERE EMPLOYEE_ID = p_salesperson_id
-    AND JOB_ID = 'SA_REP';  -- Sales Representative
-    
-    IF l_salesperson_exists = 0 THEN
-      RAISE_APPLICATION_ERROR(-20002, 'Salesperson ID does not exist or is not a sales representative');
-    END IF;
-  END IF;
-  
-  -- Create the order
+  -- Input validation""",
+    (
+        _ExistsCheck("Check if customer exists", "l_customer_exists", "CUSTOMERS",
+                     "CUSTOMER_ID = p_customer_id", True,
+                     -20001, "'Customer ID does not exist'"),
+        _ExistsCheck("Check if salesperson exists (if provided)", "l_salesperson_exists", "EMPLOYEES",
+                     "EMPLOYEE_ID = p_salesperson_id AND JOB_ID = 'SA_REP'", True,
+                     -20002, "'Salesperson ID does not exist or is not a sales representative'",
+                     guard="p_salesperson_id IS NOT NULL", feature="salespeople"),
+    ),
+    """  -- Create the order
   INSERT INTO ORDERS (
     ORDER_ID,
     CUSTOMER_ID,
     STATUS,
-    SALESPERSON_ID,
+    SALESPERSON_ID, -- [salespeople]
     ORDER_DATE,
     SHIPPING_ADDRESS,
-    SHIPPING_ADDRESS_JP,
+    SHIPPING_ADDRESS_JP, -- [jp_columns]
     SHIPPING_CITY,
-    SHIPPING_CITY_JP,
+    SHIPPING_CITY_JP, -- [jp_columns]
     SHIPPING_STATE,
     SHIPPING_ZIP,
     SHIPPING_COUNTRY,
     PAYMENT_METHOD,
     ORDER_TOTAL,
     NOTES,
-    NOTES_JP
+    NOTES_JP -- [jp_columns]
   ) VALUES (
     ORDERS_SEQ.NEXTVAL,
     p_customer_id,
     'PENDING',  -- Initial status
-    p_salesperson_id,
+    p_salesperson_id, -- [salespeople]
     SYSDATE,
     p_shipping_address,
-    p_shipping_address_jp,
+    p_shipping_address_jp, -- [jp_columns]
     p_shipping_city,
-    p_shipping_city_jp,
+    p_shipping_city_jp, -- [jp_columns]
     p_shipping_state,
     p_shipping_zip,
     p_shipping_country,
     p_payment_method,
     0,  -- Initial total, will be updated when items are added
     p_notes,
-    p_notes_jp
+    p_notes_jp -- [jp_columns]
   ) RETURNING ORDER_ID INTO p_order_id;
   
   COMMIT;
   
   DBMS_OUTPUT.PUT_LINE('New order created: Order ID ' || p_order_id || 
-                       ' for Customer ' || p_customer_id);
-EXCEPTION
-  WHEN OTHERS THEN
-    -- Roll back any changes
-    ROLLBACK;
-    
-    -- Re-raise the error
-    RAISE;
-END CREATE_ORDER;
-/"""
-        create_order_proc.add_dependency("ORDERS")
-        create_order_proc.add_dependency("CUSTOMERS")
-        create_order_proc.add_dependency("EMPLOYEES")
-        self.objects.append(create_order_proc)
-        
-        # Procedure to add items to an order
-        add_item_proc = OracleObject("ADD_ORDER_ITEM", "PROCEDURE")
-        add_item_proc.sql = """-- Procedure to add an item to an order
+                       ' for Customer ' || p_customer_id);""",
+    _ROLLBACK_FOOTER_TMPL.substitute(name="CREATE_ORDER"),
+)
+
+
+_ADD_ORDER_ITEM_SQL = """-- Procedure to add an item to an order
 CREATE OR REPLACE PROCEDURE ADD_ORDER_ITEM(
   p_order_id IN NUMBER,
   p_product_id IN NUMBER,
@@ -572,26 +664,25 @@ CREATE OR REPLACE PROCEDURE ADD_ORDER_ITEM(
   p_unit_price IN NUMBER DEFAULT NULL,  -- If NULL, use product's list price
   p_discount_percent IN NUMBER DEFAULT 0,
   p_notes IN VARCHAR2 DEFAULT NULL,
-  p_notes_jp IN VARCHAR2 DEFAULT NULL
+  p_notes_jp IN VARCHAR2 DEFAULT NULL -- [jp_columns]
 )
 IS
-  l_order_exists NUMBER;
-  l_order_status VARCHAR2(20);
-  l_product_exists NUMBER;
+  l_order_status ORDERS.STATUS%TYPE;
   l_product_price NUMBER;
   l_actual_price NUMBER;
   l_line_total NUMBER;
 BEGIN
   -- Input validation
   -- Check if order exists and is in appropriate status
-  SELECT COUNT(*), STATUS
-  INTO l_order_exists, l_order_status
-  FROM ORDERS
-  WHERE ORDER_ID = p_order_id;
-  
-  IF l_order_exists = 0 THEN
-    RAISE_APPLICATION_ERROR(-20001, 'Order ID does not exist');
-  END IF;
+  BEGIN
+    SELECT STATUS
+    INTO l_order_status
+    FROM ORDERS
+    WHERE ORDER_ID = p_order_id;
+  EXCEPTION
+    WHEN NO_DATA_FOUND THEN
+      RAISE_APPLICATION_ERROR(-20001, 'Order ID does not exist');
+  END;
   
   -- Only allow adding items to orders in PENDING or PROCESSING status
   IF l_order_status NOT IN ('PENDING', 'PROCESSING') THEN
@@ -600,14 +691,15 @@ BEGIN
   END IF;
   
   -- Check if product exists and get its price
-  SELECT COUNT(*), LIST_PRICE
-  INTO l_product_exists, l_product_price
-  FROM PRODUCTS
-  WHERE PRODUCT_ID = p_product_id;
-  
-  IF l_product_exists = 0 THEN
-    RAISE_APPLICATION_ERROR(-20003, 'Product ID does not exist');
-  END IF;
+  BEGIN
+    SELECT LIST_PRICE
+    INTO l_product_price
+    FROM PRODUCTS
+    WHERE PRODUCT_ID = p_product_id;
+  EXCEPTION
+    WHEN NO_DATA_FOUND THEN
+      RAISE_APPLICATION_ERROR(-20003, 'Product ID does not exist');
+  END;
   
   -- Validate quantity
   IF p_quantity <= 0 THEN
@@ -620,56 +712,41 @@ BEGIN
   -- Calculate line total
   l_line_total := l_actual_price * p_quantity * (1 - NVL(p_discount_percent, 0)/100);
   
-  -- Check if this product is already in the order
-  DECLARE
-    l_item_exists NUMBER;
-  BEGIN
-    SELECT COUNT(*)
-    INTO l_item_exists
-    FROM ORDER_ITEMS
-    WHERE ORDER_ID = p_order_id
-    AND PRODUCT_ID = p_product_id;
-    
-    IF l_item_exists > 0 THEN
-      -- Update existing item
-      UPDATE ORDER_ITEMS
-      SET QUANTITY = QUANTITY + p_quantity,
-          UNIT_PRICE = l_actual_price,
-          DISCOUNT_PERCENT = p_discount_percent,
-          LINE_TOTAL = LINE_TOTAL + l_line_total,
-          NOTES = NVL(p_notes, NOTES),
-          NOTES_JP = NVL(p_notes_jp, NOTES_JP)
-      WHERE ORDER_ID = p_order_id
-      AND PRODUCT_ID = p_product_id;
-      
-      DBMS_OUTPUT.PUT_LINE('Updated quantity of product ' || p_product_id || 
-                         ' in order ' || p_order_id);
-    ELSE
-      -- Add new item
-      INSERT INTO ORDER_ITEMS (
-        ORDER_ID,
-        PRODUCT_ID,
-        UNIT_PRICE,
-        QUANTITY,
-        DISCOUNT_PERCENT,
-        LINE_TOTAL,
-        NOTES,
-        NOTES_JP
-      ) VALUES (
-        p_order_id,
-        p_product_id,
-        l_actual_price,
-        p_quantity,
-        p_discount_percent,
-        l_line_total,
-        p_notes,
-        p_notes_jp
-      );
-      
-      DBMS_OUTPUT.PUT_LINE('Added product ' || p_product_id || 
-                         ' to order ' || p_order_id);
-    END IF;
-  END;
+  -- Add the item, or fold it into the existing line for this product
+  MERGE INTO ORDER_ITEMS oi
+  USING (SELECT p_order_id AS ORDER_ID, p_product_id AS PRODUCT_ID FROM DUAL) src
+  ON (oi.ORDER_ID = src.ORDER_ID AND oi.PRODUCT_ID = src.PRODUCT_ID)
+  WHEN MATCHED THEN
+    UPDATE SET
+      oi.QUANTITY = oi.QUANTITY + p_quantity,
+      oi.UNIT_PRICE = l_actual_price,
+      oi.DISCOUNT_PERCENT = p_discount_percent,
+      oi.LINE_TOTAL = oi.LINE_TOTAL + l_line_total,
+      oi.NOTES_JP = NVL(p_notes_jp, oi.NOTES_JP), -- [jp_columns]
+      oi.NOTES = NVL(p_notes, oi.NOTES)
+  WHEN NOT MATCHED THEN
+    INSERT (
+      ORDER_ID,
+      PRODUCT_ID,
+      UNIT_PRICE,
+      QUANTITY,
+      DISCOUNT_PERCENT,
+      LINE_TOTAL,
+      NOTES,
+      NOTES_JP -- [jp_columns]
+    ) VALUES (
+      src.ORDER_ID,
+      src.PRODUCT_ID,
+      l_actual_price,
+      p_quantity,
+      p_discount_percent,
+      l_line_total,
+      p_notes,
+      p_notes_jp -- [jp_columns]
+    );
+  
+  DBMS_OUTPUT.PUT_LINE('Added product ' || p_product_id || 
+                       ' to order ' || p_order_id);
   
   -- The order total will be automatically updated by a trigger
   
@@ -683,16 +760,9 @@ EXCEPTION
     RAISE;
 END ADD_ORDER_ITEM;
 /"""
-        add_item_proc.add_dependency("ORDERS")
-        add_item_proc.add_dependency("ORDER_ITEMS")
-        add_item_proc.add_dependency("PRODUCTS")
-        self.objects.append(add_item_proc)
-        
-    def _generate_utility_procedures(self) -> None:
-        """Generate utility procedures"""
-        # Procedure to purge old data
-        purge_proc = OracleObject("PURGE_OLD_DATA", "PROCEDURE")
-        purge_proc.sql = """-- Procedure to purge old data
+
+
+_PURGE_OLD_DATA_SQL = """-- Procedure to purge old data
 CREATE OR REPLACE PROCEDURE PURGE_OLD_DATA(
   p_months_old IN NUMBER DEFAULT 36,
   p_batch_size IN NUMBER DEFAULT 1000,
@@ -703,8 +773,19 @@ IS
   l_cutoff_date DATE := ADD_MONTHS(SYSDATE, -p_months_old);
   l_orders_deleted NUMBER := 0;
   l_items_deleted NUMBER := 0;
-  l_continue BOOLEAN := TRUE;
   l_batch_count NUMBER;
+  
+  -- Qualifying orders are located once and purged by ROWID
+  CURSOR c_purge IS
+    SELECT ROWID, ORDER_ID
+    FROM ORDERS
+    WHERE ORDER_DATE < l_cutoff_date
+    AND STATUS IN ('COMPLETED', 'CANCELLED', 'RETURNED', 'REFUNDED');
+  
+  TYPE rowid_table IS TABLE OF ROWID;
+  TYPE order_id_table IS TABLE OF ORDERS.ORDER_ID%TYPE;
+  l_rids rowid_table;
+  l_order_ids order_id_table;
 BEGIN
   p_rows_deleted := 0;
   
@@ -742,43 +823,32 @@ BEGIN
   END IF;
   
   -- Process in batches to avoid excessive locking
-  WHILE l_continue LOOP
+  OPEN c_purge;
+  LOOP
+    FETCH c_purge BULK COLLECT INTO l_rids, l_order_ids LIMIT p_batch_size;
+    EXIT WHEN l_rids.COUNT = 0;
+    
     -- Delete order items first (child records)
-    DELETE FROM ORDER_ITEMS
-    WHERE ORDER_ID IN (
-      SELECT ORDER_ID
-      FROM ORDERS
-      WHERE ORDER_DATE < l_cutoff_date
-      AND STATUS IN ('COMPLETED', 'CANCELLED', 'RETURNED', 'REFUNDED')
-      AND ROWNUM <= p_batch_size
-    );
+    FORALL i IN 1 .. l_order_ids.COUNT
+      DELETE FROM ORDER_ITEMS
+      WHERE ORDER_ID = l_order_ids(i);
     
-    l_batch_count := SQL%ROWCOUNT;
-    l_items_deleted := l_items_deleted + l_batch_count;
+    l_items_deleted := l_items_deleted + SQL%ROWCOUNT;
     
-    -- Exit if no more items to delete
-    IF l_batch_count = 0 THEN
-      l_continue := FALSE;
-    ELSE
-      -- Delete the orders
+    -- Delete the orders
+    FORALL i IN 1 .. l_rids.COUNT
       DELETE FROM ORDERS
-      WHERE ORDER_ID IN (
-        SELECT ORDER_ID
-        FROM ORDERS
-        WHERE ORDER_DATE < l_cutoff_date
-        AND STATUS IN ('COMPLETED', 'CANCELLED', 'RETURNED', 'REFUNDED')
-        AND ROWNUM <= p_batch_size
-      );
-      
-      l_batch_count := SQL%ROWCOUNT;
-      l_orders_deleted := l_orders_deleted + l_batch_count;
-      
-      -- Commit after each batch
-      COMMIT;
-      
-      DBMS_OUTPUT.PUT_LINE('Deleted batch: ' || l_batch_count || ' orders');
-    END IF;
+      WHERE ROWID = l_rids(i);
+    
+    l_batch_count := SQL%ROWCOUNT;
+    l_orders_deleted := l_orders_deleted + l_batch_count;
+    
+    -- Commit after each batch
+    COMMIT;
+    
+    DBMS_OUTPUT.PUT_LINE('Deleted batch: ' || l_batch_count || ' orders');
   END LOOP;
+  CLOSE c_purge;
   
   p_rows_deleted := l_orders_deleted + l_items_deleted;
   
@@ -790,6 +860,10 @@ BEGIN
   COMMIT;
 EXCEPTION
   WHEN OTHERS THEN
+    IF c_purge%ISOPEN THEN
+      CLOSE c_purge;
+    END IF;
+    
     -- Roll back any changes
     ROLLBACK;
     
@@ -797,32 +871,263 @@ EXCEPTION
     RAISE;
 END PURGE_OLD_DATA;
 /"""
-        purge_proc.add_dependency("ORDERS")
-        purge_proc.add_dependency("ORDER_ITEMS")
-        self.objects.append(purge_proc)
-        
-        # Generate test data procedure
-        test_data_proc = OracleObject("GENERATE_TEST_DATA", "PROCEDURE")
-        test_data_proc.sql = """-- Procedure to generate test data
-CREATE OR REPLACE PROCEDURE GENERATE_TEST_DATA(
-  p_employees IN NUMBER DEFAULT 10,
-  p_customers IN NUMBER DEFAULT 50,
+
+
+_GENERATE_ORDERS_CHUNK_TMPL = """-- Procedure to generate orders for one ROWID range of CUSTOMERS
+CREATE OR REPLACE PROCEDURE GENERATE_ORDERS_CHUNK(
+  p_start_rowid IN ROWID,
+  p_end_rowid IN ROWID,
   p_orders_per_customer IN NUMBER DEFAULT 3,
-  p_max_items_per_order IN NUMBER DEFAULT 5
+  p_max_items_per_order IN NUMBER DEFAULT 5,
+  p_seed IN NUMBER DEFAULT NULL
 )
 IS
-  l_order_id NUMBER;
+  CURSOR customer_cur IS
+    SELECT CUSTOMER_ID FROM CUSTOMERS
+    WHERE ROWID BETWEEN p_start_rowid AND p_end_rowid;
+  
   l_max_product_id NUMBER;
-  l_product_count NUMBER;
   l_items_per_order NUMBER;
+  
+  TYPE employee_array IS TABLE OF EMPLOYEES.EMPLOYEE_ID%TYPE INDEX BY PLS_INTEGER;
+  l_employees employee_array;
+  l_employee_count PLS_INTEGER;
+  
+  -- Value pools are split when the procedure is generated
+  TYPE string_array IS TABLE OF VARCHAR2(20 CHAR);
+  l_payment_array CONSTANT string_array := {order_payment_methods};
+  l_status_array CONSTANT string_array := {order_statuses};
+  l_payment_count CONSTANT PLS_INTEGER := l_payment_array.COUNT;
+  l_status_count CONSTANT PLS_INTEGER := l_status_array.COUNT;
+  
+  -- Customers are processed in chunks; each chunk's orders and items
+  -- are built in memory and inserted with one FORALL per table
+  c_chunk_size CONSTANT PLS_INTEGER := 500;
+  
+  TYPE id_tab_t IS TABLE OF NUMBER;
+  l_cust_ids id_tab_t;
+  l_order_ids id_tab_t;
+  
+  TYPE t_order_rec IS RECORD (
+    order_id       ORDERS.ORDER_ID%TYPE,
+    customer_id    ORDERS.CUSTOMER_ID%TYPE,
+    status         ORDERS.STATUS%TYPE,
+    salesperson_id ORDERS.SALESPERSON_ID%TYPE,
+    order_date     ORDERS.ORDER_DATE%TYPE,
+    shipping_date  ORDERS.SHIPPING_DATE%TYPE,
+    payment_method ORDERS.PAYMENT_METHOD%TYPE,
+    order_total    ORDERS.ORDER_TOTAL%TYPE,
+    item_seed      NUMBER  -- LCG state the order's items start from when p_seed is given
+  );
+  TYPE t_order_tab IS TABLE OF t_order_rec;
+  l_orders t_order_tab := t_order_tab();
+  
+  TYPE t_item_rec IS RECORD (
+    order_id         ORDER_ITEMS.ORDER_ID%TYPE,
+    product_id       ORDER_ITEMS.PRODUCT_ID%TYPE,
+    unit_price       ORDER_ITEMS.UNIT_PRICE%TYPE,
+    quantity         ORDER_ITEMS.QUANTITY%TYPE,
+    discount_percent ORDER_ITEMS.DISCOUNT_PERCENT%TYPE
+  );
+  TYPE t_item_tab IS TABLE OF t_item_rec;
+  l_items t_item_tab := t_item_tab();
+  l_order PLS_INTEGER;
+  l_item PLS_INTEGER;
+  
+  -- Order dates are relative to today; older ones are mostly completed
+  l_today CONSTANT DATE := TRUNC(SYSDATE);
+  l_cutoff CONSTANT DATE := l_today - 60;
+  
+  -- Order values come from a small LCG seeded once from DBMS_RANDOM, or
+  -- per customer from p_seed; test data does not need DBMS_RANDOM's per-call cost
+  l_rand_state NUMBER := TRUNC(DBMS_RANDOM.VALUE(0, 2147483648));
+  
+  FUNCTION rand_value(p_low IN NUMBER, p_high IN NUMBER) RETURN NUMBER IS
+  BEGIN
+    l_rand_state := MOD(l_rand_state * 1103515245 + 12345, 2147483648);
+    RETURN p_low + l_rand_state / 2147483648 * (p_high - p_low);
+  END rand_value;
+BEGIN
+  SELECT MAX(PRODUCT_ID) INTO l_max_product_id FROM PRODUCTS;
+  
+  -- Load employees into array, ordered so a seeded run picks the same ones
+  SELECT EMPLOYEE_ID BULK COLLECT INTO l_employees
+  FROM EMPLOYEES
+  WHERE JOB_ID = 'SA_REP'
+  OR JOB_ID LIKE 'SA%'
+  ORDER BY EMPLOYEE_ID;
+  
+  -- Default if no sales reps
+  IF l_employees.COUNT = 0 THEN
+    SELECT EMPLOYEE_ID BULK COLLECT INTO l_employees
+    FROM EMPLOYEES
+    ORDER BY EMPLOYEE_ID
+    FETCH FIRST 5 ROWS ONLY;
+  END IF;
+  l_employee_count := l_employees.COUNT;
+  
+  OPEN customer_cur;
+  LOOP
+    FETCH customer_cur BULK COLLECT INTO l_cust_ids LIMIT c_chunk_size;
+    EXIT WHEN l_cust_ids.COUNT = 0;
+    
+    l_orders.DELETE;
+    l_items.DELETE;
+    
+    -- Generate a random number of orders for each customer in the chunk
+    FOR c IN 1..l_cust_ids.COUNT LOOP
+      -- With a seed, a customer's orders depend only on the seed and the
+      -- customer, not on which chunk or session processes it
+      IF p_seed IS NOT NULL THEN
+        l_rand_state := DBMS_UTILITY.GET_HASH_VALUE(p_seed || ':' || l_cust_ids(c), 0, 1073741824);
+      END IF;
+      
+      FOR i IN 1..TRUNC(rand_value(1, p_orders_per_customer + 1)) LOOP
+        l_orders.EXTEND;
+        l_order := l_orders.COUNT;
+        
+        l_orders(l_order).customer_id := l_cust_ids(c);
+        
+        -- Pick random salesperson
+        l_orders(l_order).salesperson_id := l_employees(TRUNC(rand_value(1, l_employee_count + 1)));
+        
+        -- Generate order date within last 2 years
+        l_orders(l_order).order_date := l_today - TRUNC(rand_value(0, 730));
+        
+        -- Generate random status - weight toward COMPLETED for older orders
+        IF l_orders(l_order).order_date < l_cutoff THEN
+          -- Older orders more likely to be completed
+          l_orders(l_order).status := CASE TRUNC(rand_value(1, 10))
+                                        WHEN 1 THEN 'CANCELLED'
+                                        WHEN 2 THEN 'RETURNED'
+                                        ELSE 'COMPLETED'
+                                      END;
+        ELSE
+          -- Newer orders - any status
+          l_orders(l_order).status := l_status_array(TRUNC(rand_value(1, l_status_count + 1)));
+        END IF;
+        
+        IF l_orders(l_order).status IN ('SHIPPED', 'DELIVERED', 'COMPLETED', 'RETURNED') THEN
+          l_orders(l_order).shipping_date := l_orders(l_order).order_date + TRUNC(rand_value(1, 8));
+        END IF;
+        l_orders(l_order).payment_method := l_payment_array(TRUNC(rand_value(1, l_payment_count + 1)));
+        
+        IF p_seed IS NOT NULL THEN
+          l_orders(l_order).item_seed := DBMS_UTILITY.GET_HASH_VALUE(
+            p_seed || ':' || l_cust_ids(c) || ':' || i, 0, 1073741824);
+        END IF;
+      END LOOP;
+    END LOOP;
+    
+    -- Pre-allocate the chunk's order IDs in one round trip
+    SELECT ORDERS_SEQ.NEXTVAL BULK COLLECT INTO l_order_ids
+    FROM DUAL
+    CONNECT BY LEVEL <= l_orders.COUNT;
+    
+    -- Build items and accumulate each order total as they are added
+    FOR o IN 1..l_orders.COUNT LOOP
+      l_orders(o).order_id := l_order_ids(o);
+      l_orders(o).order_total := 0;
+      
+      IF p_seed IS NOT NULL THEN
+        l_rand_state := l_orders(o).item_seed;
+      END IF;
+      
+      l_items_per_order := TRUNC(rand_value(1, p_max_items_per_order + 1));
+      FOR j IN 1..l_items_per_order LOOP
+        -- Add a random product
+        l_items.EXTEND;
+        l_item := l_items.COUNT;
+        l_items(l_item).order_id := l_order_ids(o);
+        l_items(l_item).product_id := TRUNC(rand_value(1, l_max_product_id + 1));
+        l_items(l_item).unit_price := ROUND(rand_value(10, 500), 2);
+        l_items(l_item).quantity := TRUNC(rand_value(1, 11));
+        l_items(l_item).discount_percent := CASE
+                                              WHEN rand_value(0, 1) < 0.8 THEN 0  -- 80% no discount
+                                              ELSE TRUNC(rand_value(1, 7)) * 5  -- 5%, 10%, 15%, etc.
+                                            END;
+        l_orders(o).order_total := l_orders(o).order_total +
+                                   l_items(l_item).unit_price * l_items(l_item).quantity *
+                                   (1 - l_items(l_item).discount_percent / 100);
+      END LOOP;
+    END LOOP;
+    
+    -- Insert the chunk's orders and items in one bulk bind each. APPEND_VALUES
+    -- loads direct path when the table allows it, so each chunk commits
+    -- before the tables are touched again.
+    FORALL k IN 1..l_orders.COUNT
+      INSERT /*+ APPEND_VALUES */ INTO ORDERS (
+        ORDER_ID,
+        CUSTOMER_ID,
+        STATUS,
+        SALESPERSON_ID,
+        ORDER_DATE,
+        SHIPPING_DATE,
+        PAYMENT_METHOD,
+        ORDER_TOTAL
+      ) VALUES (
+        l_orders(k).order_id,
+        l_orders(k).customer_id,
+        l_orders(k).status,
+        l_orders(k).salesperson_id,
+        l_orders(k).order_date,
+        l_orders(k).shipping_date,
+        l_orders(k).payment_method,
+        l_orders(k).order_total
+      );
+    
+    FORALL k IN 1..l_items.COUNT
+      INSERT /*+ APPEND_VALUES */ INTO ORDER_ITEMS (
+        ORDER_ID,
+        PRODUCT_ID,
+        UNIT_PRICE,
+        QUANTITY,
+        DISCOUNT_PERCENT
+      ) VALUES (
+        l_items(k).order_id,
+        l_items(k).product_id,
+        l_items(k).unit_price,
+        l_items(k).quantity,
+        l_items(k).discount_percent
+      );
+    
+    COMMIT;
+  END LOOP;
+  CLOSE customer_cur;
+  
+EXCEPTION
+  WHEN OTHERS THEN
+    IF customer_cur%ISOPEN THEN
+      CLOSE customer_cur;
+    END IF;
+    ROLLBACK;
+    RAISE;
+END GENERATE_ORDERS_CHUNK;
+/"""
+
+_GENERATE_TEST_DATA_TMPL = """-- Procedure to generate test data
+CREATE OR REPLACE PROCEDURE GENERATE_TEST_DATA(
+  p_employees IN NUMBER DEFAULT 10,
+  p_customers IN NUMBER DEFAULT 50,
+  p_orders_per_customer IN NUMBER DEFAULT 3,
+  p_max_items_per_order IN NUMBER DEFAULT 5,
+  p_seed IN NUMBER DEFAULT NULL,
+  p_parallel_level IN NUMBER DEFAULT 1
+)
+IS
+  l_product_count NUMBER;
 BEGIN
   DBMS_OUTPUT.PUT_LINE('Starting test data generation at ' || 
                        TO_CHAR(SYSDATE, 'YYYY-MM-DD HH24:MI:SS'));
   
-  -- Get product count for random selection
-  SELECT MAX(PRODUCT_ID), COUNT(*)
-  INTO l_max_product_id, l_product_count
-  FROM PRODUCTS;
+  -- Seed once so a given p_seed reproduces the same employees and customers.
+  -- Order chunks run in other sessions and seed from p_seed per customer.
+  IF p_seed IS NOT NULL THEN
+    DBMS_RANDOM.SEED(p_seed);
+  END IF;
+  
+  -- Orders need products to pick from
+  SELECT COUNT(*) INTO l_product_count FROM PRODUCTS;
   
   IF l_product_count = 0 THEN
     RAISE_APPLICATION_ERROR(-20001, 'No products available for test data generation');
@@ -831,75 +1136,74 @@ BEGIN
   -- Generate employees if needed
   DECLARE
     l_employee_count NUMBER;
-    l_first_names VARCHAR2(500) := 'John,Jane,Michael,Emily,David,Sarah,Robert,Lisa,William,Mary,James,Patricia,Thomas,Jennifer,Charles,Linda';
-    l_last_names VARCHAR2(500) := 'Smith,Johnson,Williams,Jones,Brown,Davis,Miller,Wilson,Moore,Taylor,Anderson,Thomas,Jackson,White,Harris,Martin';
-    l_domains VARCHAR2(200) := 'example.com,testmail.org,fakecorp.net,mailtest.co';
-    l_job_ids VARCHAR2(100) := 'IT_PROG,SA_REP,ST_CLERK,AD_ASST,MK_REP,HR_REP,PR_REP,AC_MGR';
     
-    TYPE name_array IS TABLE OF VARCHAR2(50);
-    l_first_name_array name_array;
-    l_last_name_array name_array;
-    l_domains_array name_array;
-    l_job_array name_array;
+    -- Name pools are split when the procedure is generated
+    TYPE name_array IS TABLE OF VARCHAR2(20 CHAR);
+    l_first_name_array CONSTANT name_array := {employee_first_names};
+    l_last_name_array CONSTANT name_array := {employee_last_names};
+    l_domains_array CONSTANT name_array := {employee_domains};
+    l_job_array CONSTANT name_array := {employee_job_ids};
+    
+    -- Random picks are precomputed when the procedure is generated
+    TYPE index_tab_t IS TABLE OF PLS_INTEGER;
+    l_first_name_idx CONSTANT index_tab_t := {employee_first_name_idx};
+    l_last_name_idx CONSTANT index_tab_t := {employee_last_name_idx};
+    l_domain_idx CONSTANT index_tab_t := {employee_domain_idx};
+    l_job_idx CONSTANT index_tab_t := {employee_job_idx};
+    l_dept_ids CONSTANT index_tab_t := {employee_dept_ids};
+    l_salaries CONSTANT index_tab_t := {employee_salaries};
+    l_hire_offsets CONSTANT index_tab_t := {employee_hire_offsets};
+    l_phone_numbers CONSTANT name_array := {employee_phone_numbers};
     
-    l_first_name VARCHAR2(50);
-    l_last_name VARCHAR2(50);
-    l_email VARCHAR2(50);
-    l_job_id VARCHAR2(10);
-    l_dept_id NUMBER;
-    l_salary NUMBER;
-    l_hire_date DATE;
+    -- Rows are built in memory and inserted with a single FORALL
+    TYPE emp_rec_t IS RECORD (
+      first_name    EMPLOYEES.FIRST_NAME%TYPE,
+      last_name     EMPLOYEES.LAST_NAME%TYPE,
+      email         EMPLOYEES.EMAIL%TYPE,
+      phone_number  EMPLOYEES.PHONE_NUMBER%TYPE,
+      hire_date     EMPLOYEES.HIRE_DATE%TYPE,
+      job_id        EMPLOYEES.JOB_ID%TYPE,
+      salary        EMPLOYEES.SALARY%TYPE,
+      department_id EMPLOYEES.DEPARTMENT_ID%TYPE
+    );
+    TYPE emp_tab_t IS TABLE OF emp_rec_t;
+    l_emps emp_tab_t := emp_tab_t();
+    l_pick PLS_INTEGER;
+    l_domain VARCHAR2(20 CHAR);
   BEGIN
     -- Check how many employees exist
     SELECT COUNT(*) INTO l_employee_count FROM EMPLOYEES;
     
-    -- Split the CSV strings into arrays
-    SELECT TRIM(COLUMN_VALUE) BULK COLLECT INTO l_first_name_array
-    FROM TABLE(CAST(MULTISET(
-      SELECT REGEXP_SUBSTR(l_first_names, '[^,]+', 1, LEVEL)
-      FROM DUAL
-      CONNECT BY REGEXP_SUBSTR(l_first_names, '[^,]+', 1, LEVEL) IS NOT NULL
-    ) AS SYSTEM.ODCIVARCHAR2LIST));
-    
-    SELECT TRIM(COLUMN_VALUE) BULK COLLECT INTO l_last_name_array
-    FROM TABLE(CAST(MULTISET(
-      SELECT REGEXP_SUBSTR(l_last_names, '[^,]+', 1, LEVEL)
-      FROM DUAL
-      CONNECT BY REGEXP_SUBSTR(l_last_names, '[^,]+', 1, LEVEL) IS NOT NULL
-    ) AS SYSTEM.ODCIVARCHAR2LIST));
-    
-    SELECT TRIM(COLUMN_VALUE) BULK COLLECT INTO l_domains_array
-    FROM TABLE(CAST(MULTISET(
-      SELECT REGEXP_SUBSTR(l_domains, '[^,]+', 1, LEVEL)
-      FROM DUAL
-      CONNECT BY REGEXP_SUBSTR(l_domains, '[^,]+', 1, LEVEL) IS NOT NULL
-    ) AS SYSTEM.ODCIVARCHAR2LIST));
-    
-    SELECT TRIM(COLUMN_VALUE) BULK COLLECT INTO l_job_array
-    FROM TABLE(CAST(MULTISET(
-      SELECT REGEXP_SUBSTR(l_job_ids, '[^,]+', 1, LEVEL)
-      FROM DUAL
-      CONNECT BY REGEXP_SUBSTR(l_job_ids, '[^,]+', 1, LEVEL) IS NOT NULL
-    ) AS SYSTEM.ODCIVARCHAR2LIST));
-    
     -- Add employees if needed
     IF l_employee_count < p_employees THEN
       DBMS_OUTPUT.PUT_LINE('Generating ' || (p_employees - l_employee_count) || ' employees...');
       
-      FOR i IN 1..(p_employees - l_employee_count) LOOP
-        -- Generate random data
-        l_first_name := l_first_name_array(TRUNC(DBMS_RANDOM.VALUE(1, l_first_name_array.COUNT + 1)));
-        l_last_name := l_last_name_array(TRUNC(DBMS_RANDOM.VALUE(1, l_last_name_array.COUNT + 1)));
-        l_email := UPPER(SUBSTR(l_first_name, 1, 1) || l_last_name) || '@' ||
-                   l_domains_array(TRUNC(DBMS_RANDOM.VALUE(1, l_domains_array.COUNT + 1)));
-        l_job_id := l_job_array(TRUNC(DBMS_RANDOM.VALUE(1, l_job_array.COUNT + 1)));
-        l_dept_id := TRUNC(DBMS_RANDOM.VALUE(10, 110) / 10) * 10; -- 10, 20, ..., 100
-        l_salary := TRUNC(DBMS_RANDOM.VALUE(3000, 15000));
-        l_hire_date := TO_DATE('2015-01-01', 'YYYY-MM-DD') + 
-                       TRUNC(DBMS_RANDOM.VALUE(0, (SYSDATE - TO_DATE('2015-01-01', 'YYYY-MM-DD'))));
+      l_emps.EXTEND(p_employees - l_employee_count);
+      
+      FOR i IN 1..l_emps.COUNT LOOP
+        -- Continue the pick cycles after the existing employees, so a repeat
+        -- run does not rebuild the same rows. Picks repeat well before the
+        -- cycles do, so the pick number also keeps EMAIL unique.
+        l_pick := l_employee_count + i - 1;
         
-        -- Insert employee
-        INSERT INTO EMPLOYEES (
+        l_emps(i).first_name := l_first_name_array(l_first_name_idx(MOD(l_pick, l_first_name_idx.COUNT) + 1));
+        l_emps(i).last_name := l_last_name_array(l_last_name_idx(MOD(l_pick, l_last_name_idx.COUNT) + 1));
+        -- Shorten the name so the pick number and domain fit EMAIL's 25 characters
+        l_domain := l_domains_array(l_domain_idx(MOD(l_pick, l_domain_idx.COUNT) + 1));
+        l_emps(i).email := SUBSTR(LOWER(SUBSTR(l_emps(i).first_name, 1, 1) || l_emps(i).last_name),
+                                  1, 24 - LENGTH(l_domain) - LENGTH(l_pick + 1)) ||
+                           (l_pick + 1) || '@' || l_domain;
+        l_emps(i).phone_number := l_phone_numbers(MOD(l_pick, l_phone_numbers.COUNT) + 1);
+        l_emps(i).hire_date := DATE '2015-01-01' + l_hire_offsets(MOD(l_pick, l_hire_offsets.COUNT) + 1);
+        l_emps(i).job_id := l_job_array(l_job_idx(MOD(l_pick, l_job_idx.COUNT) + 1));
+        l_emps(i).salary := l_salaries(MOD(l_pick, l_salaries.COUNT) + 1);
+        l_emps(i).department_id := l_dept_ids(MOD(l_pick, l_dept_ids.COUNT) + 1);
+      END LOOP;
+      
+      -- Insert all employees in one bulk bind. APPEND_VALUES loads direct
+      -- path when the table allows it, so commit before touching it again.
+      FORALL i IN 1..l_emps.COUNT
+        INSERT /*+ APPEND_VALUES */ INTO EMPLOYEES (
           EMPLOYEE_ID,
           FIRST_NAME,
           LAST_NAME,
@@ -911,21 +1215,15 @@ BEGIN
           DEPARTMENT_ID
         ) VALUES (
           EMPLOYEES_SEQ.NEXTVAL,
-          l_first_name,
-          l_last_name,
-          l_email,
-          '555-' || TO_CHAR(TRUNC(DBMS_RANDOM.VALUE(100, 1000)), 'FM000') || '-' || 
-          TO_CHAR(TRUNC(DBMS_RANDOM.VALUE(1000, 10000)), 'FM0000'),
-          l_hire_date,
-          l_job_id,
-          l_salary,
-          l_dept_id
+          l_emps(i).first_name,
+          l_emps(i).last_name,
+          l_emps(i).email,
+          l_emps(i).phone_number,
+          l_emps(i).hire_date,
+          l_emps(i).job_id,
+          l_emps(i).salary,
+          l_emps(i).department_id
         );
-        
-        IF MOD(i, 10) = 0 THEN
-          COMMIT;
-        END IF;
-      END LOOP;
       
       COMMIT;
       DBMS_OUTPUT.PUT_LINE('Generated employees: ' || (p_employees - l_employee_count));
@@ -935,270 +1233,116 @@ BEGIN
   -- Generate customers if needed
   DECLARE
     l_customer_count NUMBER;
-    l_first_names VARCHAR2(500) := 'James,Mary,John,Patricia,Robert,Jennifer,Michael,Linda,William,Elizabeth,David,Barbara,Richard,Susan,Joseph,Jessica';
-    l_last_names VARCHAR2(500) := 'Smith,Johnson,Williams,Brown,Jones,Garcia,Miller,Davis,Rodriguez,Martinez,Hernandez,Lopez,Gonzalez,Wilson,Anderson,Thomas';
-    l_domains VARCHAR2(200) := 'gmail.com,yahoo.com,hotmail.com,aol.com,outlook.com,icloud.com,protonmail.com';
-    l_cities VARCHAR2(300) := 'New York,Los Angeles,Chicago,Houston,Phoenix,Philadelphia,San Antonio,San Diego,Dallas,San Jose,Austin,Jacksonville,Fort Worth,Columbus,Charlotte';
-    l_states VARCHAR2(200) := 'NY,CA,IL,TX,AZ,PA,TX,CA,TX,CA,TX,FL,TX,OH,NC';
-    
-    TYPE name_array IS TABLE OF VARCHAR2(50);
-    l_first_name_array name_array;
-    l_last_name_array name_array;
-    l_domains_array name_array;
-    l_cities_array name_array;
-    l_states_array name_array;
     
-    l_first_name VARCHAR2(50);
-    l_last_name VARCHAR2(50);
-    l_email VARCHAR2(50);
-    l_city VARCHAR2(30);
-    l_state VARCHAR2(2);
-    l_credit_limit NUMBER;
+    -- Registration dates fall between the epoch and today
+    l_epoch CONSTANT DATE := DATE '2018-01-01';
+    l_span CONSTANT PLS_INTEGER := TRUNC(SYSDATE) - l_epoch;
   BEGIN
     -- Check how many customers exist
     SELECT COUNT(*) INTO l_customer_count FROM CUSTOMERS;
     
-    -- Split the CSV strings into arrays
-    SELECT TRIM(COLUMN_VALUE) BULK COLLECT INTO l_first_name_array
-    FROM TABLE(CAST(MULTISET(
-      SELECT REGEXP_SUBSTR(l_first_names, '[^,]+', 1, LEVEL)
-      FROM DUAL
-      CONNECT BY REGEXP_SUBSTR(l_first_names, '[^,]+', 1, LEVEL) IS NOT NULL
-    ) AS SYSTEM.ODCIVARCHAR2LIST));
-    
-    SELECT TRIM(COLUMN_VALUE) BULK COLLECT INTO l_last_name_array
-    FROM TABLE(CAST(MULTISET(
-      SELECT REGEXP_SUBSTR(l_last_names, '[^,]+', 1, LEVEL)
-      FROM DUAL
-      CONNECT BY REGEXP_SUBSTR(l_last_names, '[^,]+', 1, LEVEL) IS NOT NULL
-    ) AS SYSTEM.ODCIVARCHAR2LIST));
-    
-    SELECT TRIM(COLUMN_VALUE) BULK COLLECT INTO l_domains_array
-    FROM TABLE(CAST(MULTISET(
-      SELECT REGEXP_SUBSTR(l_domains, '[^,]+', 1, LEVEL)
-      FROM DUAL
-      CONNECT BY REGEXP_SUBSTR(l_domains, '[^,]+', 1, LEVEL) IS NOT NULL
-    ) AS SYSTEM.ODCIVARCHAR2LIST));
-    
-    SELECT TRIM(COLUMN_VALUE) BULK COLLECT INTO l_cities_array
-    FROM TABLE(CAST(MULTISET(
-      SELECT REGEXP_SUBSTR(l_cities, '[^,]+', 1, LEVEL)
-      FROM DUAL
-      CONNECT BY REGEXP_SUBSTR(l_cities, '[^,]+', 1, LEVEL) IS NOT NULL
-    ) AS SYSTEM.ODCIVARCHAR2LIST));
-    
-    SELECT TRIM(COLUMN_VALUE) BULK COLLECT INTO l_states_array
-    FROM TABLE(CAST(MULTISET(
-      SELECT REGEXP_SUBSTR(l_states, '[^,]+', 1, LEVEL)
-      FROM DUAL
-      CONNECT BY REGEXP_SUBSTR(l_states, '[^,]+', 1, LEVEL) IS NOT NULL
-    ) AS SYSTEM.ODCIVARCHAR2LIST));
-    
     -- Add customers if needed
     IF l_customer_count < p_customers THEN
       DBMS_OUTPUT.PUT_LINE('Generating ' || (p_customers - l_customer_count) || ' customers...');
       
-      FOR i IN 1..(p_customers - l_customer_count) LOOP
-        -- Generate random data
-        l_first_name := l_first_name_array(TRUNC(DBMS_RANDOM.VALUE(1, l_first_name_array.COUNT + 1)));
-        l_last_name := l_last_name_array(TRUNC(DBMS_RANDOM.VALUE(1, l_last_name_array.COUNT + 1)));
-        l_email := LOWER(l_first_name || '.' || l_last_name || TRUNC(DBMS_RANDOM.VALUE(1, 1000))) || '@' ||
-                   l_domains_array(TRUNC(DBMS_RANDOM.VALUE(1, l_domains_array.COUNT + 1)));
-        l_city := l_cities_array(TRUNC(DBMS_RANDOM.VALUE(1, l_cities_array.COUNT + 1)));
-        l_state := l_states_array(TRUNC(DBMS_RANDOM.VALUE(1, l_states_array.COUNT + 1)));
-        l_credit_limit := TRUNC(DBMS_RANDOM.VALUE(1000, 10000) / 100) * 100; -- Round to nearest hundred
-        
-        -- Insert customer
-        INSERT INTO CUSTOMERS (
-          CUSTOMER_ID,
-          FIRST_NAME,
-          LAST_NAME,
-          EMAIL,
-          PHONE,
-          ADDRESS,
-          CITY,
-          STATE,
-          POSTAL_CODE,
-          COUNTRY,
-          CREDIT_LIMIT,
-          REGISTRATION_DATE
-        ) VALUES (
-          CUSTOMERS_SEQ.NEXTVAL,
-          l_first_name,
-          l_last_name,
-          l_email,
-          '555-' || TO_CHAR(TRUNC(DBMS_RANDOM.VALUE(100, 1000)), 'FM000') || '-' || 
-          TO_CHAR(TRUNC(DBMS_RANDOM.VALUE(1000, 10000)), 'FM0000'),
-          TRUNC(DBMS_RANDOM.VALUE(100, 10000)) || ' ' || 
-          CASE TRUNC(DBMS_RANDOM.VALUE(1, 5))
-            WHEN 1 THEN 'Main'
-            WHEN 2 THEN 'Oak'
-            WHEN 3 THEN 'Pine'
-            WHEN 4 THEN 'Maple'
-            ELSE 'Cedar'
-          END || ' ' ||
-          CASE TRUNC(DBMS_RANDOM.VALUE(1, 4))
-            WHEN 1 THEN 'St'
-            WHEN 2 THEN 'Ave'
-            WHEN 3 THEN 'Rd'
-            ELSE 'Blvd'
-          END,
-          l_city,
-          l_state,
-          TO_CHAR(TRUNC(DBMS_RANDOM.VALUE(10000, 100000)), 'FM00000'),
-          'USA',
-          l_credit_limit,
-          TO_DATE('2018-01-01', 'YYYY-MM-DD') + 
-          TRUNC(DBMS_RANDOM.VALUE(0, (SYSDATE - TO_DATE('2018-01-01', 'YYYY-MM-DD'))))
-        );
-        
-        IF MOD(i, 10) = 0 THEN
-          COMMIT;
-        END IF;
-      END LOOP;
+      -- Generate every customer in one set-based statement. Random values
+      -- are drawn once per row in r and the value pools, which are split
+      -- when the procedure is generated, are joined in by position.
+      INSERT /*+ APPEND */ INTO CUSTOMERS (
+        CUSTOMER_ID,
+        FIRST_NAME,
+        LAST_NAME,
+        EMAIL,
+        PHONE,
+        ADDRESS,
+        CITY,
+        STATE,
+        POSTAL_CODE,
+        COUNTRY,
+        CREDIT_LIMIT,
+        REGISTRATION_DATE
+      )
+      SELECT CUSTOMERS_SEQ.NEXTVAL,
+             fn.val,
+             ln.val,
+             LOWER(fn.val || '.' || ln.val || r.email_suffix) || '@' || dom.val,
+             r.phone,
+             r.street_number || ' ' || street.val || ' ' || sfx.val,
+             city.val,
+             st.val,
+             r.postal_code,
+             'USA',
+             r.credit_limit,
+             r.registration_date
+      FROM (
+        SELECT /*+ NO_MERGE */
+               TRUNC(DBMS_RANDOM.VALUE(1, {customer_first_name_count} + 1)) AS first_name_idx,
+               TRUNC(DBMS_RANDOM.VALUE(1, {customer_last_name_count} + 1)) AS last_name_idx,
+               TRUNC(DBMS_RANDOM.VALUE(1, 1000)) AS email_suffix,
+               TRUNC(DBMS_RANDOM.VALUE(1, {customer_domain_count} + 1)) AS domain_idx,
+               '555-' || TO_CHAR(TRUNC(DBMS_RANDOM.VALUE(100, 1000)), 'FM000') || '-' ||
+               TO_CHAR(TRUNC(DBMS_RANDOM.VALUE(1000, 10000)), 'FM0000') AS phone,
+               TRUNC(DBMS_RANDOM.VALUE(100, 10000)) AS street_number,
+               TRUNC(DBMS_RANDOM.VALUE(1, {customer_street_count} + 1)) AS street_idx,
+               TRUNC(DBMS_RANDOM.VALUE(1, {customer_street_suffix_count} + 1)) AS suffix_idx,
+               TRUNC(DBMS_RANDOM.VALUE(1, {customer_city_count} + 1)) AS city_idx,
+               TRUNC(DBMS_RANDOM.VALUE(1, {customer_state_count} + 1)) AS state_idx,
+               TO_CHAR(TRUNC(DBMS_RANDOM.VALUE(10000, 100000)), 'FM00000') AS postal_code,
+               TRUNC(DBMS_RANDOM.VALUE(10, 100)) * 100 AS credit_limit, -- Whole hundreds, 1000 to 9900
+               l_epoch + TRUNC(DBMS_RANDOM.VALUE(0, l_span)) AS registration_date
+        FROM DUAL
+        CONNECT BY LEVEL <= p_customers - l_customer_count
+      ) r
+{customer_pool_joins};
       
       COMMIT;
       DBMS_OUTPUT.PUT_LINE('Generated customers: ' || (p_customers - l_customer_count));
     END IF;
   END;
   
-  -- Generate orders
+  -- Generate orders. With one worker GENERATE_ORDERS_CHUNK covers all
+  -- customers in this session. With more, customers are split into ROWID
+  -- chunks that it generates and commits in parallel sessions. Those run
+  -- as DBMS_PARALLEL_EXECUTE scheduler jobs, so the owner needs the
+  -- CREATE JOB privilege, and CREATE_TASK and RUN_TASK commit the current
+  -- transaction.
   DECLARE
-    CURSOR customer_cur IS
-      SELECT CUSTOMER_ID FROM CUSTOMERS;
-    
-    CURSOR employee_cur IS
-      SELECT EMPLOYEE_ID FROM EMPLOYEES
-      WHERE JOB_ID = 'SA_REP'
-      OR JOB_ID LIKE 'SA%';
-    
-    TYPE employee_array IS TABLE OF EMPLOYEES.EMPLOYEE_ID%TYPE;
-    l_employees employee_array;
-    
-    l_salesperson NUMBER;
-    l_order_date DATE;
-    l_status VARCHAR2(20);
-    l_payment_methods VARCHAR2(100) := 'CREDIT,DEBIT,BANK_TRANSFER,PAYPAL,CASH';
-    l_statuses VARCHAR2(200) := 'PENDING,PROCESSING,SHIPPED,DELIVERED,COMPLETED,CANCELLED,RETURNED,REFUNDED';
-    
-    TYPE string_array IS TABLE OF VARCHAR2(50);
-    l_payment_array string_array;
-    l_status_array string_array;
+    l_task_name VARCHAR2(128);
+    l_first_rowid ROWID;
+    l_last_rowid ROWID;
   BEGIN
-    -- Load employees into array
-    SELECT EMPLOYEE_ID BULK COLLECT INTO l_employees
-    FROM EMPLOYEES
-    WHERE JOB_ID = 'SA_REP'
-    OR JOB_ID LIKE 'SA%';
-    
-    -- Default if no sales reps
-    IF l_employees.COUNT = 0 THEN
-      SELECT EMPLOYEE_ID BULK COLLECT INTO l_employees
-      FROM EMPLOYEES
-      WHERE ROWNUM <= 5;
-    END IF;
-    
-    -- Split the CSV strings into arrays
-    SELECT TRIM(COLUMN_VALUE) BULK COLLECT INTO l_payment_array
-    FROM TABLE(CAST(MULTISET(
-      SELECT REGEXP_SUBSTR(l_payment_methods, '[^,]+', 1, LEVEL)
-      FROM DUAL
-      CONNECT BY REGEXP_SUBSTR(l_payment_methods, '[^,]+', 1, LEVEL) IS NOT NULL
-    ) AS SYSTEM.ODCIVARCHAR2LIST));
-    
-    SELECT TRIM(COLUMN_VALUE) BULK COLLECT INTO l_status_array
-    FROM TABLE(CAST(MULTISET(
-      SELECT REGEXP_SUBSTR(l_statuses, '[^,]+', 1, LEVEL)
-      FROM DUAL
-      CONNECT BY REGEXP_SUBSTR(l_statuses, '[^,]+', 1, LEVEL) IS NOT NULL
-    ) AS SYSTEM.ODCIVARCHAR2LIST));
-    
-    -- Generate orders for customers
     DBMS_OUTPUT.PUT_LINE('Generating orders...');
     
-    FOR cust_rec IN customer_cur LOOP
-      -- Generate random number of orders for this customer
-      FOR i IN 1..TRUNC(DBMS_RANDOM.VALUE(1, p_orders_per_customer + 1)) LOOP
-        -- Pick random salesperson
-        l_salesperson := l_employees(TRUNC(DBMS_RANDOM.VALUE(1, l_employees.COUNT + 1)));
-        
-        -- Generate order date within last 2 years
-        l_order_date := TO_DATE(SYSDATE - TRUNC(DBMS_RANDOM.VALUE(0, 730)));
-        
-        -- Generate random status - weight toward COMPLETED for older orders
-        IF l_order_date < SYSDATE - 60 THEN
-          -- Older orders more likely to be completed
-          l_status := CASE TRUNC(DBMS_RANDOM.VALUE(1, 10))
-                        WHEN 1 THEN 'CANCELLED'
-                        WHEN 2 THEN 'RETURNED'
-                        ELSE 'COMPLETED'
-                      END;
-        ELSE
-          -- Newer orders - any status
-          l_status := l_status_array(TRUNC(DBMS_RANDOM.VALUE(1, l_status_array.COUNT + 1)));
-        END IF;
-        
-        -- Create the order
-        INSERT INTO ORDERS (
-          ORDER_ID,
-          CUSTOMER_ID,
-          STATUS,
-          SALESPERSON_ID,
-          ORDER_DATE,
-          SHIPPING_DATE,
-          PAYMENT_METHOD,
-          ORDER_TOTAL
-        ) VALUES (
-          ORDERS_SEQ.NEXTVAL,
-          cust_rec.CUSTOMER_ID,
-          l_status,
-          l_salesperson,
-          l_order_date,
-          CASE 
-            WHEN l_status IN ('SHIPPED', 'DELIVERED', 'COMPLETED', 'RETURNED') 
-            THEN l_order_date + TRUNC(DBMS_RANDOM.VALUE(1, 8))
-            ELSE NULL
-          END,
-          l_payment_array(TRUNC(DBMS_RANDOM.VALUE(1, l_payment_array.COUNT + 1))),
-          0  -- Will be updated when items are added
-        ) RETURNING ORDER_ID INTO l_order_id;
-        
-        -- Generate order items
-        l_items_per_order := TRUNC(DBMS_RANDOM.VALUE(1, p_max_items_per_order + 1));
-        
-        -- Add items
-        FOR j IN 1..l_items_per_order LOOP
-          -- Add a random product
-          INSERT INTO ORDER_ITEMS (
-            ORDER_ID,
-            PRODUCT_ID,
-            UNIT_PRICE,
-            QUANTITY,
-            DISCOUNT_PERCENT
-          ) VALUES (
-            l_order_id,
-            TRUNC(DBMS_RANDOM.VALUE(1, l_max_product_id + 1)),
-            ROUND(DBMS_RANDOM.VALUE(10, 500), 2),
-            TRUNC(DBMS_RANDOM.VALUE(1, 11)),
-            CASE
-              WHEN DBMS_RANDOM.VALUE(0, 1) < 0.8 THEN 0  -- 80% no discount
-              ELSE TRUNC(DBMS_RANDOM.VALUE(5, 31) / 5) * 5  -- 5%, 10%, 15%, etc.
-            END
-          );
-        END LOOP;
-        
-        -- Update order total (trigger should handle this, but just in case)
-        UPDATE ORDERS
-        SET ORDER_TOTAL = (
-          SELECT SUM(UNIT_PRICE * QUANTITY * (1 - DISCOUNT_PERCENT/100))
-          FROM ORDER_ITEMS
-          WHERE ORDER_ID = l_order_id
-        )
-        WHERE ORDER_ID = l_order_id;
-      END LOOP;
+    IF NVL(p_parallel_level, 1) <= 1 THEN
+      SELECT MIN(ROWID), MAX(ROWID) INTO l_first_rowid, l_last_rowid FROM CUSTOMERS;
+      GENERATE_ORDERS_CHUNK(l_first_rowid, l_last_rowid, p_orders_per_customer,
+                            p_max_items_per_order, p_seed);
+    ELSE
+      l_task_name := DBMS_PARALLEL_EXECUTE.GENERATE_TASK_NAME('GEN_ORDERS');
+      DBMS_PARALLEL_EXECUTE.CREATE_TASK(l_task_name);
+      DBMS_PARALLEL_EXECUTE.CREATE_CHUNKS_BY_ROWID(
+        task_name   => l_task_name,
+        table_owner => USER,
+        table_name  => 'CUSTOMERS',
+        by_row      => TRUE,
+        chunk_size  => 500
+      );
+      DBMS_PARALLEL_EXECUTE.RUN_TASK(
+        task_name      => l_task_name,
+        sql_stmt       => 'BEGIN GENERATE_ORDERS_CHUNK(:start_id, :end_id, ' ||
+                          TO_CHAR(TRUNC(p_orders_per_customer)) || ', ' ||
+                          TO_CHAR(TRUNC(p_max_items_per_order)) || ', ' ||
+                          NVL(TO_CHAR(TRUNC(p_seed)), 'NULL') || '); END;',
+        language_flag  => DBMS_SQL.NATIVE,
+        parallel_level => p_parallel_level
+      );
       
-      COMMIT;
-    END LOOP;
+      -- Leave a failed task in place so USER_PARALLEL_EXECUTE_CHUNKS shows why
+      IF DBMS_PARALLEL_EXECUTE.TASK_STATUS(l_task_name) != DBMS_PARALLEL_EXECUTE.FINISHED THEN
+        RAISE_APPLICATION_ERROR(-20002, 'Order generation task ' || l_task_name || ' did not finish');
+      END IF;
+      DBMS_PARALLEL_EXECUTE.DROP_TASK(l_task_name);
+    END IF;
     
     DBMS_OUTPUT.PUT_LINE('Test data generation completed at ' || 
                          TO_CHAR(SYSDATE, 'YYYY-MM-DD HH24:MI:SS'));
@@ -1212,137 +1356,447 @@ EXCEPTION
     RAISE;
 END GENERATE_TEST_DATA;
 /"""
-        test_data_proc.add_dependency("EMPLOYEES")
-        test_data_proc.add_dependency("CUSTOMERS")
-        test_data_proc.add_dependency("ORDERS")
-        test_data_proc.add_dependency("ORDER_ITEMS")
-        test_data_proc.add_dependency("PRODUCTS")
-        self.objects.append(test_data_proc)
-        
-    def _generate_validation_procedures(self) -> None:
-        """Generate data validation procedures"""
-        # Procedure to validate email addresses
-        email_proc = OracleObject("VALIDATE_EMAIL", "PROCEDURE")
-        email_proc.sql = """-- Procedure to validate email addresses
+
+_GENERATE_ORDERS_CHUNK_SQL = _GENERATE_ORDERS_CHUNK_TMPL.format(
+    order_payment_methods=_collection_literal("string_array", _ORDER_PAYMENT_METHODS),
+    order_statuses=_collection_literal("string_array", _ORDER_STATUSES),
+)
+
+# Pools joined into the customer INSERT ... SELECT: (alias, values, index column in r)
+_CUSTOMER_POOL_JOINS = (
+    ('fn', _CUSTOMER_FIRST_NAMES, 'first_name_idx'),
+    ('ln', _CUSTOMER_LAST_NAMES, 'last_name_idx'),
+    ('dom', _CUSTOMER_DOMAINS, 'domain_idx'),
+    ('street', _CUSTOMER_STREETS, 'street_idx'),
+    ('sfx', _CUSTOMER_STREET_SUFFIXES, 'suffix_idx'),
+    ('city', _CUSTOMER_CITIES, 'city_idx'),
+    ('st', _CUSTOMER_STATES, 'state_idx'),
+)
+
+_GENERATE_TEST_DATA_SQL = _GENERATE_TEST_DATA_TMPL.format(
+    employee_first_names=_collection_literal("name_array", _EMPLOYEE_FIRST_NAMES),
+    employee_last_names=_collection_literal("name_array", _EMPLOYEE_LAST_NAMES),
+    employee_domains=_collection_literal("name_array", _EMPLOYEE_DOMAINS),
+    employee_job_ids=_collection_literal("name_array", _EMPLOYEE_JOB_IDS),
+    customer_pool_joins="\n".join(_pool_join(alias, values, index_column)
+                                   for alias, values, index_column in _CUSTOMER_POOL_JOINS),
+    customer_first_name_count=len(_CUSTOMER_FIRST_NAMES),
+    customer_last_name_count=len(_CUSTOMER_LAST_NAMES),
+    customer_domain_count=len(_CUSTOMER_DOMAINS),
+    customer_city_count=len(_CUSTOMER_CITIES),
+    customer_state_count=len(_CUSTOMER_STATES),
+    customer_street_count=len(_CUSTOMER_STREETS),
+    customer_street_suffix_count=len(_CUSTOMER_STREET_SUFFIXES),
+    **_employee_random_picks(_TEST_DATA_SEED),
+)
+
+
+_IS_EMAIL_FORMAT_SQL = """-- Function to check the format of an email address
+CREATE OR REPLACE FUNCTION IS_EMAIL_FORMAT(
+  p_email IN VARCHAR2
+) RETURN NUMBER DETERMINISTIC RESULT_CACHE
+IS
+  PRAGMA UDF;
+BEGIN
+  IF REGEXP_LIKE(p_email, '^[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\\.[A-Za-z]{2,}$') THEN
+    RETURN 1;
+  END IF;
+  RETURN 0;
+END IS_EMAIL_FORMAT;
+/"""
+
+_IS_POSTAL_CODE_FORMAT_SQL = """-- Function to check the format of a postal code for a country
+CREATE OR REPLACE FUNCTION IS_POSTAL_CODE_FORMAT(
+  p_postal_code IN VARCHAR2,
+  p_country IN VARCHAR2
+) RETURN NUMBER DETERMINISTIC RESULT_CACHE
+IS
+  PRAGMA UDF;
+  l_valid BOOLEAN;
+  
+  -- Single pass over the code: N is a digit, A a letter, X either, and
+  -- any other mask character must match literally (case-insensitive)
+  FUNCTION matches_mask(p_mask IN VARCHAR2) RETURN BOOLEAN IS
+    l_char VARCHAR2(1 CHAR);
+  BEGIN
+    IF LENGTH(p_postal_code) != LENGTH(p_mask) THEN
+      RETURN FALSE;
+    END IF;
+    
+    FOR k IN 1..LENGTH(p_mask) LOOP
+      l_char := UPPER(SUBSTR(p_postal_code, k, 1));
+      IF NOT CASE SUBSTR(p_mask, k, 1)
+               WHEN 'N' THEN INSTR('0123456789', l_char) > 0
+               WHEN 'A' THEN INSTR('ABCDEFGHIJKLMNOPQRSTUVWXYZ', l_char) > 0
+               WHEN 'X' THEN INSTR('0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ', l_char) > 0
+               ELSE l_char = SUBSTR(p_mask, k, 1)
+             END THEN
+        RETURN FALSE;
+      END IF;
+    END LOOP;
+    RETURN TRUE;
+  END matches_mask;
+BEGIN
+  IF p_postal_code IS NULL THEN
+    RETURN 0;
+  END IF;
+  
+  CASE UPPER(p_country)
+    -- Japanese postal code (NNN-NNNN or NNNNNNN)
+    WHEN 'JAPAN' THEN
+      l_valid := matches_mask('NNN-NNNN') OR matches_mask('NNNNNNN');
+    
+    -- US zip code (NNNNN or NNNNN-NNNN)
+    WHEN 'USA' THEN
+      l_valid := matches_mask('NNNNN') OR matches_mask('NNNNN-NNNN');
+    
+    -- UK postcode: outward code of 2-4 characters, then NAA
+    WHEN 'UK' THEN
+      l_valid := matches_mask('AN NAA') OR matches_mask('ANX NAA') OR
+                 matches_mask('AAN NAA') OR matches_mask('AANX NAA');
+    
+    -- Canadian postal code (ANA NAN)
+    WHEN 'CANADA' THEN
+      l_valid := matches_mask('ANA NAN');
+    
+    -- Anything else only has to be alphanumeric, spaces or hyphens
+    ELSE
+      l_valid := TRANSLATE(UPPER(p_postal_code),
+                           '#0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ -', '#') IS NULL;
+  END CASE;
+  
+  IF l_valid THEN
+    RETURN 1;
+  END IF;
+  RETURN 0;
+END IS_POSTAL_CODE_FORMAT;
+/"""
+
+_VALIDATE_EMAIL_SQL = """-- Procedure to validate email addresses
 CREATE OR REPLACE PROCEDURE VALIDATE_EMAIL(
   p_email IN VARCHAR2,
-  p_is_valid OUT BOOLEAN,
-  p_error_message OUT VARCHAR2
+  p_is_valid OUT NUMBER,
+  p_error_message OUT NOCOPY VARCHAR2
 )
 IS
 BEGIN
   -- Initialize output parameters
-  p_is_valid := TRUE;
+  p_is_valid := 1;
   p_error_message := NULL;
   
   -- Basic validation checks
   IF p_email IS NULL THEN
-    p_is_valid := FALSE;
+    p_is_valid := 0;
     p_error_message := 'Email address cannot be null';
     RETURN;
   END IF;
   
   -- Check for minimum length
   IF LENGTH(p_email) < 6 THEN
-    p_is_valid := FALSE;
+    p_is_valid := 0;
     p_error_message := 'Email address is too short';
     RETURN;
   END IF;
   
   -- Check for @ symbol
   IF INSTR(p_email, '@') = 0 THEN
-    p_is_valid := FALSE;
+    p_is_valid := 0;
     p_error_message := 'Email address must contain @ symbol';
     RETURN;
   END IF;
   
-  -- Check format using regular expression
-  IF NOT REGEXP_LIKE(p_email, '^[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\\.[A-Za-z]{2,}) THEN
-    p_is_valid := FALSE;
-    p_error_message := 'Email address format is invalid';
-    RETURN;
-  END IF;
-  
   -- Check for consecutive dots
   IF INSTR(p_email, '..') > 0 THEN
-    p_is_valid := FALSE;
+    p_is_valid := 0;
     p_error_message := 'Email address contains consecutive dots';
     RETURN;
   END IF;
   
-  -- Check for Japanese characters (if present, not invalid but flag it)
-  IF REGEXP_LIKE(p_email, '[\\p{IsHiragana}\\p{IsKatakana}\\p{IsHan}]') THEN
+  -- Check format using the cached regular expression check
+  IF IS_EMAIL_FORMAT(p_email) = 0 THEN
+    p_is_valid := 0;
+    p_error_message := 'Email address format is invalid';
+    RETURN;
+  END IF;
+  
+  -- Check for Japanese characters (if present, not invalid but flag it);
+  -- pure ASCII addresses skip the regular expression entirely
+  IF ASCIISTR(p_email) != p_email
+     AND REGEXP_LIKE(p_email, '[\\p{IsHiragana}\\p{IsKatakana}\\p{IsHan}]') THEN
     p_error_message := 'Warning: Email contains Japanese characters which may cause compatibility issues';
   END IF;
   
   -- Email is valid
-  p_is_valid := TRUE;
+  p_is_valid := 1;
 END VALIDATE_EMAIL;
 /"""
-        self.objects.append(email_proc)
-        
-        # Procedure to validate postal codes
-        postal_proc = OracleObject("VALIDATE_POSTAL_CODE", "PROCEDURE")
-        postal_proc.sql = """-- Procedure to validate postal codes based on country
+
+
+_VALIDATE_POSTAL_CODE_SQL = """-- Procedure to validate postal codes based on country
 CREATE OR REPLACE PROCEDURE VALIDATE_POSTAL_CODE(
   p_postal_code IN VARCHAR2,
   p_country IN VARCHAR2,
-  p_is_valid OUT BOOLEAN,
-  p_error_message OUT VARCHAR2
+  p_is_valid OUT NUMBER,
+  p_error_message OUT NOCOPY VARCHAR2
 )
 IS
 BEGIN
   -- Initialize output parameters
-  p_is_valid := TRUE;
+  p_is_valid := 1;
   p_error_message := NULL;
   
   -- Handle NULL values
   IF p_postal_code IS NULL THEN
-    p_is_valid := FALSE;
+    p_is_valid := 0;
     p_error_message := 'Postal code cannot be null';
     RETURN;
   END IF;
   
-  -- Check based on country
-  CASE UPPER(p_country)
-    -- Japanese postal code validation (NNN-NNNN)
-    WHEN 'JAPAN' THEN
-      IF NOT REGEXP_LIKE(p_postal_code, '^[0-9]{3}-[0-9]{4}) AND 
-         NOT REGEXP_LIKE(p_postal_code, '^[0-9]{7}) THEN
-        p_is_valid := FALSE;
-        p_error_message := 'Japanese postal code must be in format NNN-NNNN or NNNNNNN';
-      END IF;
+  -- Check format using the cached format check
+  IF IS_POSTAL_CODE_FORMAT(p_postal_code, p_country) = 0 THEN
+    p_is_valid := 0;
+    p_error_message := CASE UPPER(p_country)
+                         WHEN 'JAPAN' THEN 'Japanese postal code must be in format NNN-NNNN or NNNNNNN'
+                         WHEN 'USA' THEN 'US zip code must be in format NNNNN or NNNNN-NNNN'
+                         WHEN 'UK' THEN 'UK postcode format is invalid'
+                         WHEN 'CANADA' THEN 'Canadian postal code must be in format ANA NAN'
+                         ELSE 'Postal code contains invalid characters'
+                       END;
+  END IF;
+END VALIDATE_POSTAL_CODE;
+/"""
+
+
+# Object types shared by every generated procedure and helper function
+_KIND_PROCEDURE = sys.intern("PROCEDURE")
+_KIND_FUNCTION = sys.intern("FUNCTION")
+# Object type of the batch script, which holds both procedures and functions
+_KIND_SCRIPT = sys.intern("SCRIPT")
+
+
+def _interned(*names: str) -> Tuple[str, ...]:
+    """Intern object names so dependency lookups downstream compare by identity first"""
+    return tuple(sys.intern(name) for name in names)
+
+
+# Tables and helper functions each generated procedure depends on
+_PROCEDURE_DEPENDENCIES: Dict[str, Tuple[str, ...]] = {
+    "CREATE_DEPARTMENT": _interned("DEPARTMENTS", "LOCATIONS", "EMPLOYEES"),
+    "RELOCATE_DEPARTMENT": _interned("DEPARTMENTS", "LOCATIONS", "EMPLOYEES"),
+    "HIRE_EMPLOYEE": _interned("EMPLOYEES", "DEPARTMENTS", "JOBS"),
+    "TRANSFER_EMPLOYEE": _interned("EMPLOYEES", "DEPARTMENTS", "JOBS"),
+    "CREATE_ORDER": _interned("ORDERS", "CUSTOMERS", "EMPLOYEES"),
+    "ADD_ORDER_ITEM": _interned("ORDERS", "ORDER_ITEMS", "PRODUCTS"),
+    "PURGE_OLD_DATA": _interned("ORDERS", "ORDER_ITEMS"),
+    "GENERATE_ORDERS_CHUNK": _interned("CUSTOMERS", "EMPLOYEES", "ORDERS", "ORDER_ITEMS", "PRODUCTS"),
+    "GENERATE_TEST_DATA": _interned("EMPLOYEES", "CUSTOMERS", "PRODUCTS", "GENERATE_ORDERS_CHUNK"),
+    "VALIDATE_EMAIL": _interned("IS_EMAIL_FORMAT"),
+    "VALIDATE_POSTAL_CODE": _interned("IS_POSTAL_CODE_FORMAT"),
+}
+
+
+def _clone_object(obj: OracleObject) -> OracleObject:
+    """Copy an OracleObject so the caller can mutate it without touching the cache"""
+    clone = copy.copy(obj)
+    clone.dependencies = list(obj.dependencies)
+    return clone
+
+
+def _memoize_procedures(method: Callable) -> Callable:
+    """
+    Cache the objects produced by a _generate_* method.
     
-    -- US zip code validation (NNNNN or NNNNN-NNNN)
-    WHEN 'USA' THEN
-      IF NOT REGEXP_LIKE(p_postal_code, '^[0-9]{5}(-[0-9]{4})?) THEN
-        p_is_valid := FALSE;
-        p_error_message := 'US zip code must be in format NNNNN or NNNNN-NNNN';
-      END IF;
+    The generated SQL depends only on the table name and schema features, so
+    the first call builds the objects and later calls receive fresh copies of
+    the cached ones.
+    """
+    cache: Dict[Tuple, List[OracleObject]] = {}
     
-    -- UK postcode validation (more complex pattern)
-    WHEN 'UK' THEN
-      IF NOT REGEXP_LIKE(p_postal_code, '^[A-Z]{1,2}[0-9][A-Z0-9]? [0-9][A-Z]{2}, 'i') THEN
-        p_is_valid := FALSE;
-        p_error_message := 'UK postcode format is invalid';
-      END IF;
+    @functools.wraps(method)
+    def wrapper(self, *args):
+        key = tuple(arg.name if isinstance(arg, TableInfo) else arg for arg in args)
+        if key not in cache:
+            cache[key] = method(self, *args)
+        return [_clone_object(obj) for obj in cache[key]]
     
-    -- Canadian postal code validation (ANA NAN)
-    WHEN 'CANADA' THEN
-      IF NOT REGEXP_LIKE(p_postal_code, '^[A-Z][0-9][A-Z] [0-9][A-Z][0-9], 'i') THEN
-        p_is_valid := FALSE;
-        p_error_message := 'Canadian postal code must be in format ANA NAN';
-      END IF;
+    return wrapper
+
+
+class ProcedureGenerator(OracleObjectGenerator):
+    """
+    Generates Oracle stored procedure objects
+    """
+    def __init__(self):
+        super().__init__()
+        # Table name -> generator for that table's procedures
+        self._table_handlers: Dict[str, Callable[[TableInfo, SchemaFeatures], List[OracleObject]]] = {
+            'EMPLOYEES': self._generate_employee_procedures,
+            'DEPARTMENTS': self._generate_department_procedures,
+            'ORDERS': self._generate_order_procedures,
+        }
+        
+    def generate(self, tables: List[TableInfo], num_procedures: int = 3, batch: bool = False,
+                 features: Optional[SchemaFeatures] = None, **kwargs) -> List[OracleObject]:
+        """
+        Generate Oracle procedures for tables and common operations
+        
+        When batch is True the procedures are emitted as a single SCRIPT object
+        (see emit_batch) so they can be deployed in one round trip. features
+        selects the optional paths to emit; everything is included by default.
+        """
+        # Collect everything locally and grow self.objects once at the end
+        procedures = list(self.iter_procedures(tables, features))
+        
+        if batch:
+            batch_obj = OracleObject("PROCEDURES_BATCH", _KIND_SCRIPT)
+            batch_obj.sql = self.emit_batch(procedures)
+            batch_obj.add_dependencies(dep for proc in procedures for dep in proc.dependencies)
+            procedures = [batch_obj]
+        
+        self.objects.extend(procedures)
+        return self.objects
     
-    -- Default validation - just check for alphanumeric characters
-    ELSE
-      IF NOT REGEXP_LIKE(p_postal_code, '^[A-Z0-9 -]+, 'i') THEN
-        p_is_valid := FALSE;
-        p_error_message := 'Postal code contains invalid characters';
-      END IF;
-  END CASE;
-END VALIDATE_POSTAL_CODE;
-/"""
-        self.objects.append(postal_proc)
+    def iter_procedures(self, tables: List[TableInfo],
+                        features: Optional[SchemaFeatures] = None) -> Iterator[OracleObject]:
+        """
+        Yield the procedures for the given tables one at a time
+        
+        Unlike generate(), nothing is recorded in self.objects, so streaming
+        writers can emit each procedure and let it go.
+        """
+        if features is None:
+            features = SchemaFeatures()
+        
+        # Generate table-specific procedures; JP parameters and columns are
+        # only emitted for tables that actually have *_JP columns
+        for table_info in tables:
+            handler = self._table_handlers.get(table_info.name)
+            if handler:
+                table_features = features._replace(
+                    jp_columns=features.jp_columns and _has_jp_columns(table_info))
+                yield from handler(table_info, table_features)
+        
+        # Generate utility procedures
+        yield from self._generate_utility_procedures()
+        
+        # Generate data validation procedures
+        yield from self._generate_validation_procedures()
+    
+    def emit_batch(self, objects: Optional[Iterable[OracleObject]] = None) -> str:
+        """
+        Join procedure DDL into a single deployable script
+        
+        Each object's SQL is terminated by exactly one "/" line. Defaults to all
+        objects generated so far.
+        """
+        return join_sql_script(self.objects if objects is None else objects)
+        
+    @_memoize_procedures
+    def _generate_department_procedures(self, table_info: TableInfo, features: SchemaFeatures) -> List[OracleObject]:
+        """Generate procedures for the DEPARTMENTS table"""
+        procedures: List[OracleObject] = []
+        
+        # Procedure to create a new department
+        create_dept_proc = OracleObject("CREATE_DEPARTMENT", _KIND_PROCEDURE)
+        create_dept_proc.sql = _specialize(_CREATE_DEPARTMENT_SQL, features)
+        create_dept_proc.set_dependencies(_PROCEDURE_DEPENDENCIES["CREATE_DEPARTMENT"])
+        procedures.append(create_dept_proc)
+        
+        # Procedure to relocate a department
+        relocate_proc = OracleObject("RELOCATE_DEPARTMENT", _KIND_PROCEDURE)
+        relocate_proc.sql = _specialize(_RELOCATE_DEPARTMENT_SQL, features)
+        relocate_proc.set_dependencies(_PROCEDURE_DEPENDENCIES["RELOCATE_DEPARTMENT"])
+        procedures.append(relocate_proc)
+        
+        return procedures
+    
+    @_memoize_procedures
+    def _generate_employee_procedures(self, table_info: TableInfo, features: SchemaFeatures) -> List[OracleObject]:
+        """Generate procedures for the EMPLOYEES table"""
+        procedures: List[OracleObject] = []
+        
+        # Procedure to hire a new employee
+        hire_proc = OracleObject("HIRE_EMPLOYEE", _KIND_PROCEDURE)
+        hire_proc.sql = _specialize(_HIRE_EMPLOYEE_SQL, features)
+        hire_proc.set_dependencies(_PROCEDURE_DEPENDENCIES["HIRE_EMPLOYEE"])
+        procedures.append(hire_proc)
+        
+        # Procedure to transfer an employee
+        transfer_proc = OracleObject("TRANSFER_EMPLOYEE", _KIND_PROCEDURE)
+        transfer_proc.sql = _specialize(_TRANSFER_EMPLOYEE_SQL, features)
+        transfer_proc.set_dependencies(_PROCEDURE_DEPENDENCIES["TRANSFER_EMPLOYEE"])
+        procedures.append(transfer_proc)
+        
+        return procedures
+    
+    @_memoize_procedures
+    def _generate_order_procedures(self, table_info: TableInfo, features: SchemaFeatures) -> List[OracleObject]:
+        """Generate procedures for the ORDERS table"""
+        procedures: List[OracleObject] = []
+        
+        # Procedure to create a new order
+        create_order_proc = OracleObject("CREATE_ORDER", _KIND_PROCEDURE)
+        create_order_proc.sql = _specialize(_CREATE_ORDER_SQL, features)
+        create_order_proc.set_dependencies(_PROCEDURE_DEPENDENCIES["CREATE_ORDER"])
+        procedures.append(create_order_proc)
+        
+        # Procedure to add items to an order
+        add_item_proc = OracleObject("ADD_ORDER_ITEM", _KIND_PROCEDURE)
+        add_item_proc.sql = _specialize(_ADD_ORDER_ITEM_SQL, features)
+        add_item_proc.set_dependencies(_PROCEDURE_DEPENDENCIES["ADD_ORDER_ITEM"])
+        procedures.append(add_item_proc)
+        
+        return procedures
+    
+    @_memoize_procedures
+    def _generate_utility_procedures(self) -> List[OracleObject]:
+        """Generate utility procedures"""
+        procedures: List[OracleObject] = []
+        
+        # Procedure to purge old data
+        purge_proc = OracleObject("PURGE_OLD_DATA", _KIND_PROCEDURE)
+        purge_proc.sql = _PURGE_OLD_DATA_SQL
+        purge_proc.set_dependencies(_PROCEDURE_DEPENDENCIES["PURGE_OLD_DATA"])
+        procedures.append(purge_proc)
+        
+        # Per-chunk order generation, run in parallel by GENERATE_TEST_DATA
+        orders_chunk_proc = OracleObject("GENERATE_ORDERS_CHUNK", _KIND_PROCEDURE)
+        orders_chunk_proc.sql = _GENERATE_ORDERS_CHUNK_SQL
+        orders_chunk_proc.set_dependencies(_PROCEDURE_DEPENDENCIES["GENERATE_ORDERS_CHUNK"])
+        procedures.append(orders_chunk_proc)
+        
+        # Generate test data procedure
+        test_data_proc = OracleObject("GENERATE_TEST_DATA", _KIND_PROCEDURE)
+        test_data_proc.sql = _GENERATE_TEST_DATA_SQL
+        test_data_proc.set_dependencies(_PROCEDURE_DEPENDENCIES["GENERATE_TEST_DATA"])
+        procedures.append(test_data_proc)
+        
+        return procedures
+    
+    @_memoize_procedures
+    def _generate_validation_procedures(self) -> List[OracleObject]:
+        """Generate data validation procedures and the format checks they call"""
+        procedures: List[OracleObject] = []
+        
+        # Result-cached format checks used by the validation procedures
+        email_format_func = OracleObject("IS_EMAIL_FORMAT", _KIND_FUNCTION)
+        email_format_func.sql = _IS_EMAIL_FORMAT_SQL
+        procedures.append(email_format_func)
+        
+        postal_format_func = OracleObject("IS_POSTAL_CODE_FORMAT", _KIND_FUNCTION)
+        postal_format_func.sql = _IS_POSTAL_CODE_FORMAT_SQL
+        procedures.append(postal_format_func)
+        
+        # Procedure to validate email addresses
+        email_proc = OracleObject("VALIDATE_EMAIL", _KIND_PROCEDURE)
+        email_proc.sql = _VALIDATE_EMAIL_SQL
+        email_proc.set_dependencies(_PROCEDURE_DEPENDENCIES["VALIDATE_EMAIL"])
+        procedures.append(email_proc)
+        
+        # Procedure to validate postal codes
+        postal_proc = OracleObject("VALIDATE_POSTAL_CODE", _KIND_PROCEDURE)
+        postal_proc.sql = _VALIDATE_POSTAL_CODE_SQL
+        postal_proc.set_dependencies(_PROCEDURE_DEPENDENCIES["VALIDATE_POSTAL_CODE"])
+        procedures.append(postal_proc)
         
-        return self.objects
\ No newline at end of file
+        return procedures
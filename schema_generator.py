@@ -9,8 +9,270 @@ constraints, indexes, and other schema objects.
 Author: John Clark Naldoza
 """
 
-from typing import List, Dict, Any
-from core import OracleObjectGenerator, OracleObject, TableInfo
+import io
+import itertools
+import string
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import List, Sequence, Tuple
+from core import OracleObjectGenerator, OracleObject, TableInfo, Column
+
+# Storage clauses shared by every table, primary key and unique index
+_PK_STORAGE = ("\n  USING INDEX TABLESPACE USERS PCTFREE 10 INITRANS 2 MAXTRANS 255 COMPUTE STATISTICS \n"
+                "  STORAGE(INITIAL 65536 NEXT 1048576 MINEXTENTS 1 MAXEXTENTS 2147483645\n"
+                "  PCTINCREASE 0 FREELISTS 1 FREELIST GROUPS 1\n"
+                "  BUFFER_POOL DEFAULT FLASH_CACHE DEFAULT CELL_FLASH_CACHE DEFAULT)")
+_TABLE_STORAGE = ("\n)\nTABLESPACE USERS PCTFREE 10 PCTUSED 40 INITRANS 1 MAXTRANS 255 \n"
+                   "NOLOGGING STORAGE(INITIAL 65536 NEXT 1048576 MINEXTENTS 1 MAXEXTENTS 2147483645\n"
+                   "PCTINCREASE 0 FREELISTS 1 FREELIST GROUPS 1\n"
+                   "BUFFER_POOL DEFAULT FLASH_CACHE DEFAULT CELL_FLASH_CACHE DEFAULT)")
+_INDEX_STORAGE = """
+TABLESPACE USERS PCTFREE 10 INITRANS 2 MAXTRANS 255 COMPUTE STATISTICS
+STORAGE(INITIAL 65536 NEXT 1048576 MINEXTENTS 1 MAXEXTENTS 2147483645
+PCTINCREASE 0 FREELISTS 1 FREELIST GROUPS 1
+BUFFER_POOL DEFAULT FLASH_CACHE DEFAULT CELL_FLASH_CACHE DEFAULT)"""
+
+# CREATE TABLE statement; $tail closes the column list and adds any storage clause
+_CREATE_TABLE_TMPL = string.Template("CREATE TABLE $table \n(\n  $elements$tail;")
+
+def _column(name: str, type_: str, constraints: str = "") -> Column:
+    """Build a Column, splitting a comma-separated constraint list into a set.
+    
+    The names, types and constraint tokens repeat across the tables, so they
+    are interned to share one string object each.
+    """
+    constraint_set = (frozenset(sys.intern(c.strip()) for c in constraints.split(','))
+                      if constraints else frozenset())
+    not_null = " NOT NULL" if 'NOT NULL' in constraint_set else ""
+    return Column(sys.intern(name), sys.intern(type_), constraint_set, f"{name} {type_}{not_null}")
+
+# Table structure as (table name, columns)
+_TableStructure = Tuple[str, Tuple[Column, ...]]
+
+# Common Oracle database table structures, built once at import time
+_COMMON_TABLES: Tuple[_TableStructure, ...] = (
+    # Employees table
+    ("EMPLOYEES", (
+        _column('EMPLOYEE_ID', 'NUMBER(6)', 'PRIMARY KEY'),
+        _column('FIRST_NAME', 'VARCHAR2(20)'),
+        _column('LAST_NAME', 'VARCHAR2(25)', 'NOT NULL'),
+        _column('FIRST_NAME_JP', 'VARCHAR2(20)'),
+        _column('LAST_NAME_JP', 'VARCHAR2(25)'),
+        _column('EMAIL', 'VARCHAR2(25)', 'UNIQUE'),
+        _column('PHONE_NUMBER', 'VARCHAR2(20)'),
+        _column('HIRE_DATE', 'DATE', 'NOT NULL'),
+        _column('JOB_ID', 'VARCHAR2(10)', 'NOT NULL'),
+        _column('SALARY', 'NUMBER(8,2)'),
+        _column('COMMISSION_PCT', 'NUMBER(2,2)'),
+        _column('MANAGER_ID', 'NUMBER(6)'),
+        _column('DEPARTMENT_ID', 'NUMBER(4)'),
+        _column('NOTES_JP', 'CLOB'),
+    )),
+
+    # Departments table
+    ("DEPARTMENTS", (
+        _column('DEPARTMENT_ID', 'NUMBER(4)', 'PRIMARY KEY'),
+        _column('DEPARTMENT_NAME', 'VARCHAR2(30)', 'NOT NULL'),
+        _column('DEPARTMENT_NAME_JP', 'VARCHAR2(30)'),
+        _column('MANAGER_ID', 'NUMBER(6)'),
+        _column('LOCATION_ID', 'NUMBER(4)'),
+        _column('DESCRIPTION_JP', 'CLOB'),
+    )),
+
+    # Jobs table
+    ("JOBS", (
+        _column('JOB_ID', 'VARCHAR2(10)', 'PRIMARY KEY'),
+        _column('JOB_TITLE', 'VARCHAR2(35)', 'NOT NULL'),
+        _column('JOB_TITLE_JP', 'VARCHAR2(35)'),
+        _column('MIN_SALARY', 'NUMBER(6)'),
+        _column('MAX_SALARY', 'NUMBER(6)'),
+        _column('JOB_DESCRIPTION', 'CLOB'),
+        _column('JOB_DESCRIPTION_JP', 'CLOB'),
+    )),
+
+    # Locations table
+    ("LOCATIONS", (
+        _column('LOCATION_ID', 'NUMBER(4)', 'PRIMARY KEY'),
+        _column('STREET_ADDRESS', 'VARCHAR2(40)'),
+        _column('STREET_ADDRESS_JP', 'VARCHAR2(40)'),
+        _column('POSTAL_CODE', 'VARCHAR2(12)'),
+        _column('CITY', 'VARCHAR2(30)', 'NOT NULL'),
+        _column('CITY_JP', 'VARCHAR2(30)'),
+        _column('STATE_PROVINCE', 'VARCHAR2(25)'),
+        _column('STATE_PROVINCE_JP', 'VARCHAR2(25)'),
+        _column('COUNTRY_ID', 'CHAR(2)'),
+    )),
+
+    # Products table
+    ("PRODUCTS", (
+        _column('PRODUCT_ID', 'NUMBER(6)', 'PRIMARY KEY'),
+        _column('PRODUCT_NAME', 'VARCHAR2(50)', 'NOT NULL'),
+        _column('PRODUCT_NAME_JP', 'VARCHAR2(50)'),
+        _column('DESCRIPTION', 'VARCHAR2(2000)'),
+        _column('DESCRIPTION_JP', 'VARCHAR2(2000)'),
+        _column('CATEGORY_ID', 'NUMBER(4)'),
+        _column('STANDARD_COST', 'NUMBER(9,2)'),
+        _column('LIST_PRICE', 'NUMBER(9,2)'),
+        _column('CREATED_DATE', 'DATE'),
+        _column('MODIFIED_DATE', 'DATE'),
+    )),
+
+    # Customers table
+    ("CUSTOMERS", (
+        _column('CUSTOMER_ID', 'NUMBER(6)', 'PRIMARY KEY'),
+        _column('FIRST_NAME', 'VARCHAR2(20)'),
+        _column('LAST_NAME', 'VARCHAR2(25)', 'NOT NULL'),
+        _column('FIRST_NAME_JP', 'VARCHAR2(20)'),
+        _column('LAST_NAME_JP', 'VARCHAR2(25)'),
+        _column('EMAIL', 'VARCHAR2(50)', 'UNIQUE'),
+        _column('PHONE', 'VARCHAR2(20)'),
+        _column('ADDRESS', 'VARCHAR2(100)'),
+        _column('ADDRESS_JP', 'VARCHAR2(100)'),
+        _column('CITY', 'VARCHAR2(30)'),
+        _column('CITY_JP', 'VARCHAR2(30)'),
+        _column('STATE', 'VARCHAR2(20)'),
+        _column('STATE_JP', 'VARCHAR2(20)'),
+        _column('POSTAL_CODE', 'VARCHAR2(10)'),
+        _column('COUNTRY', 'VARCHAR2(20)'),
+        _column('COUNTRY_JP', 'VARCHAR2(20)'),
+        _column('CREDIT_LIMIT', 'NUMBER(9,2)'),
+        _column('REGISTRATION_DATE', 'DATE'),
+    )),
+
+    # Orders table (additional table for relationships)
+    ("ORDERS", (
+        _column('ORDER_ID', 'NUMBER(12)', 'PRIMARY KEY'),
+        _column('CUSTOMER_ID', 'NUMBER(6)', 'NOT NULL'),
+        _column('STATUS', 'VARCHAR2(20)', 'NOT NULL'),
+        _column('SALESPERSON_ID', 'NUMBER(6)'),
+        _column('ORDER_DATE', 'DATE', 'NOT NULL'),
+        _column('SHIPPING_DATE', 'DATE'),
+        _column('SHIPPING_ADDRESS', 'VARCHAR2(255)'),
+        _column('SHIPPING_ADDRESS_JP', 'VARCHAR2(255)'),
+        _column('SHIPPING_CITY', 'VARCHAR2(30)'),
+        _column('SHIPPING_CITY_JP', 'VARCHAR2(30)'),
+        _column('SHIPPING_STATE', 'VARCHAR2(20)'),
+        _column('SHIPPING_ZIP', 'VARCHAR2(10)'),
+        _column('SHIPPING_COUNTRY', 'VARCHAR2(20)'),
+        _column('PAYMENT_METHOD', 'VARCHAR2(20)'),
+        _column('ORDER_TOTAL', 'NUMBER(10,2)'),
+        _column('NOTES', 'CLOB'),
+        _column('NOTES_JP', 'CLOB'),
+    )),
+
+    # Order Items table
+    ("ORDER_ITEMS", (
+        _column('ORDER_ID', 'NUMBER(12)', 'NOT NULL'),
+        _column('PRODUCT_ID', 'NUMBER(6)', 'NOT NULL'),
+        _column('UNIT_PRICE', 'NUMBER(10,2)', 'NOT NULL'),
+        _column('QUANTITY', 'NUMBER(8)', 'NOT NULL'),
+        _column('DISCOUNT_PERCENT', 'NUMBER(4,2)'),
+        _column('LINE_TOTAL', 'NUMBER(10,2)'),
+        _column('NOTES', 'VARCHAR2(500)'),
+        _column('NOTES_JP', 'VARCHAR2(500)'),
+    )),
+)
+
+# Foreign keys as (table, constraint, column, referenced table, referenced column)
+_FOREIGN_KEYS: Tuple[Tuple[str, str, str, str, str], ...] = (
+    ("EMPLOYEES", "EMP_DEPT_FK", "DEPARTMENT_ID", "DEPARTMENTS", "DEPARTMENT_ID"),
+    ("EMPLOYEES", "EMP_JOB_FK", "JOB_ID", "JOBS", "JOB_ID"),
+    ("EMPLOYEES", "EMP_MANAGER_FK", "MANAGER_ID", "EMPLOYEES", "EMPLOYEE_ID"),
+    ("DEPARTMENTS", "DEPT_MGR_FK", "MANAGER_ID", "EMPLOYEES", "EMPLOYEE_ID"),
+    ("DEPARTMENTS", "DEPT_LOC_FK", "LOCATION_ID", "LOCATIONS", "LOCATION_ID"),
+    ("ORDERS", "ORD_CUST_FK", "CUSTOMER_ID", "CUSTOMERS", "CUSTOMER_ID"),
+    ("ORDERS", "ORD_EMP_FK", "SALESPERSON_ID", "EMPLOYEES", "EMPLOYEE_ID"),
+    ("ORDER_ITEMS", "ORDITM_ORD_FK", "ORDER_ID", "ORDERS", "ORDER_ID"),
+    ("ORDER_ITEMS", "ORDITM_PROD_FK", "PRODUCT_ID", "PRODUCTS", "PRODUCT_ID"),
+)
+
+# Check constraints as (table, constraint, condition)
+_CHECK_CONSTRAINTS: Tuple[Tuple[str, str, str], ...] = (
+    ("EMPLOYEES", "EMP_SALARY_MIN", "SALARY > 0"),
+    ("JOBS", "JOB_SALARY_RANGE", "MIN_SALARY < MAX_SALARY"),
+    ("ORDER_ITEMS", "ORDITM_QTY_MIN", "QUANTITY > 0"),
+    ("PRODUCTS", "PROD_PRICE_MIN", "LIST_PRICE >= 0"),
+)
+
+# Sequences as (sequence, start value, increment)
+_SEQUENCES: Tuple[Tuple[str, int, int], ...] = (
+    ("EMPLOYEES_SEQ", 1000, 1),
+    ("DEPARTMENTS_SEQ", 100, 10),
+    ("LOCATIONS_SEQ", 1000, 100),
+    ("PRODUCTS_SEQ", 10000, 1),
+    ("CUSTOMERS_SEQ", 1, 1),
+    ("ORDERS_SEQ", 10000, 1),
+)
+
+# Comments as (table, table comment, ((column, column comment), ...))
+_COMMENTS: Tuple[Tuple[str, str, Tuple[Tuple[str, str], ...]], ...] = (
+    ("EMPLOYEES", "Contains employee information including Japanese name fields", (
+        ("EMPLOYEE_ID", "Primary key of employees table"),
+        ("FIRST_NAME_JP", "First name in Japanese"),
+        ("LAST_NAME_JP", "Last name in Japanese"),
+        ("HIRE_DATE", "Date when the employee was hired"),
+    )),
+    ("DEPARTMENTS", "Contains department information", (
+        ("DEPARTMENT_NAME_JP", "Department name in Japanese"),
+    )),
+    ("JOBS", "Contains job information including salary ranges", (
+        ("JOB_TITLE_JP", "Job title in Japanese"),
+    )),
+    ("CUSTOMERS", "Customer information table", (
+        ("FIRST_NAME_JP", "Customer first name in Japanese"),
+        ("LAST_NAME_JP", "Customer last name in Japanese"),
+    )),
+    ("ORDERS", "Order header information", (
+        ("SHIPPING_ADDRESS_JP", "Shipping address in Japanese"),
+    )),
+    ("ORDER_ITEMS", "Order line items", (
+        ("NOTES_JP", "Item notes in Japanese"),
+    )),
+)
+
+_FK_SQL = "-- Foreign Key Constraints\n" + "\n\n".join(
+    f"ALTER TABLE {table} ADD CONSTRAINT {name}\n"
+    f"  FOREIGN KEY ({column}) REFERENCES {ref_table} ({ref_column})\n"
+    f"  ENABLE VALIDATE;"
+    for table, name, column, ref_table, ref_column in _FOREIGN_KEYS)
+
+_CHECK_SQL = "-- Check Constraints\n" + "\n\n".join(
+    f"ALTER TABLE {table} ADD CONSTRAINT {name}\n"
+    f"  CHECK ({condition}) ENABLE VALIDATE;"
+    for table, name, condition in _CHECK_CONSTRAINTS)
+
+_SEQ_SQL = "-- Sequences for primary key generation\n" + "\n\n".join(
+    f"CREATE SEQUENCE {name}\n"
+    f"  START WITH {start}\n"
+    f"  INCREMENT BY {increment}\n"
+    f"  NOCACHE\n"
+    f"  NOCYCLE;"
+    for name, start, increment in _SEQUENCES)
+
+_COMMENTS_SQL = "-- Table and Column Comments\n" + "\n\n".join(
+    "\n".join(itertools.chain(
+        (f"COMMENT ON TABLE {table} IS '{table_comment}';",),
+        (f"COMMENT ON COLUMN {table}.{column} IS '{comment}';" for column, comment in column_comments)))
+    for table, table_comment, column_comments in _COMMENTS)
+
+# Schema object as (name, object type, SQL, dependencies)
+_ObjectRecord = Tuple[str, str, str, Tuple[str, ...]]
+
+# Rendered tables as (CREATE TABLE records, unique index records of each table)
+_RenderedTables = Tuple[Tuple[_ObjectRecord, ...], Tuple[Tuple[_ObjectRecord, ...], ...]]
+
+# Fixed schema objects shared by every generated schema
+_STATIC_OBJECTS: Tuple[_ObjectRecord, ...] = (
+    ("FOREIGN_KEYS", "CONSTRAINT", _FK_SQL,
+     tuple(dict.fromkeys(table for fk in _FOREIGN_KEYS for table in (fk[0], fk[3])))),
+    ("CHECK_CONSTRAINTS", "CONSTRAINT", _CHECK_SQL,
+     tuple(dict.fromkeys(table for table, _, _ in _CHECK_CONSTRAINTS))),
+    ("SEQUENCES", "SEQUENCE", _SEQ_SQL, ()),
+    ("COMMENTS", "COMMENT", _COMMENTS_SQL,
+     tuple(table for table, _, _ in _COMMENTS)),
+)
+
 
 class SchemaGenerator(OracleObjectGenerator):
     """
@@ -22,368 +284,98 @@ class SchemaGenerator(OracleObjectGenerator):
         
     def generate(self, table_count: int = 6, include_storage: bool = True, **kwargs) -> List[OracleObject]:
         """Generate Oracle schema objects"""
-        # Generate tables
-        table_structures = self._generate_common_oracle_tables()
-        table_count = min(table_count, len(table_structures))
-        
-        tables_to_generate = table_structures[:table_count]
+        # Generate tables; clamping keeps one cache entry per distinct result
+        table_count = max(0, min(table_count, len(_COMMON_TABLES)))
         
         # Create TableInfo objects for each table
-        for table_structure in tables_to_generate:
-            table_name = table_structure[0]['table']
-            self.tables.append(TableInfo(table_name, table_structure))
-            
-            # Create table object
-            table_obj = OracleObject(table_name, "TABLE")
-            table_obj.sql = self._generate_create_table(table_name, table_structure, include_storage)
-            self.objects.append(table_obj)
-            
-        # Generate additional schema objects
-        self._generate_indexes_and_constraints(include_storage)
-        self._generate_sequences()
-        self._generate_comments()
+        self.tables.extend([TableInfo(table_name, columns)
+                            for table_name, columns in itertools.islice(self._generate_common_oracle_tables(), table_count)])
+        
+        # The SQL only depends on the arguments, so wrap the cached records
+        # in fresh objects the caller is free to modify. Extending with a
+        # sized list grows self.objects once rather than per append.
+        self.objects.extend([OracleObject.from_record(*record)
+                             for record in self._cached_objects(table_count, bool(include_storage))])
         
         return self.objects
+    
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def _cached_objects(table_count: int, include_storage: bool) -> Tuple[_ObjectRecord, ...]:
+        """Assemble the schema object records for the first table_count tables"""
+        table_records, index_records = SchemaGenerator._render_tables(include_storage)
+        return tuple(itertools.chain(table_records[:table_count],
+                                     *index_records[:table_count],
+                                     _STATIC_OBJECTS))
+    
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _render_tables(include_storage: bool) -> _RenderedTables:
+        """
+        Render the table and unique index records of every common table
+        
+        The common tables never change, so this runs once per storage setting
+        and generate() only slices the rendered records.
+        """
+        table_names = [table_name for table_name, _ in _COMMON_TABLES]
         
-    def _generate_create_table(self, table_name: str, columns: List[Dict[str, Any]], include_storage: bool = True) -> str:
+        # Each CREATE TABLE is rendered independently, so map them over a pool
+        with ThreadPoolExecutor() as executor:
+            create_sqls = executor.map(SchemaGenerator._generate_create_table,
+                                       table_names, [columns for _, columns in _COMMON_TABLES],
+                                       itertools.repeat(include_storage))
+            table_records = tuple((table_name, "TABLE", sql, ())
+                                  for table_name, sql in zip(table_names, create_sqls))
+        
+        index_records = tuple(SchemaGenerator._generate_unique_indexes(table_name, columns, include_storage)
+                              for table_name, columns in _COMMON_TABLES)
+        return table_records, index_records
+        
+    @staticmethod
+    def _generate_create_table(table_name: str, columns: Sequence[Column], include_storage: bool = True) -> str:
         """Generate a CREATE TABLE statement"""
-        column_definitions = []
-        constraints = []
+        # Column definitions are precomputed when the table structures are built,
+        # so stream them straight into the element list
+        elements = io.StringIO()
+        separator = ""
         pk_columns = []
-        
-        # First pass to identify primary key and collect column definitions
         for col in columns:
-            col_def = f"{col['name']} {col['type']}"
-            if 'constraints' in col and col['constraints']:
-                if 'NOT NULL' in col['constraints']:
-                    col_def += " NOT NULL"
-                if 'PRIMARY KEY' in col['constraints']:
-                    pk_columns.append(col['name'])
-            column_definitions.append(col_def)
+            elements.write(separator)
+            elements.write(col.definition)
+            separator = ",\n  "
+            if 'PRIMARY KEY' in col.constraints:
+                pk_columns.append(col.name)
         
         # Add primary key constraint if any
         if pk_columns:
-            pk_constraint = f"CONSTRAINT {table_name}_PK PRIMARY KEY ({', '.join(pk_columns)})"
+            elements.write(f",\n  CONSTRAINT {table_name}_PK PRIMARY KEY ({', '.join(pk_columns)})")
             if include_storage:
-                pk_constraint += f"\n  USING INDEX TABLESPACE USERS PCTFREE 10 INITRANS 2 MAXTRANS 255 COMPUTE STATISTICS \n  STORAGE(INITIAL 65536 NEXT 1048576 MINEXTENTS 1 MAXEXTENTS 2147483645\n  PCTINCREASE 0 FREELISTS 1 FREELIST GROUPS 1\n  BUFFER_POOL DEFAULT FLASH_CACHE DEFAULT CELL_FLASH_CACHE DEFAULT)"
-            constraints.append(pk_constraint)
-        
-        # Build the complete CREATE TABLE statement
-        create_stmt = f"CREATE TABLE {table_name} \n(\n  " + ",\n  ".join(column_definitions)
-        
-        # Add constraint definitions
-        if constraints:
-            create_stmt += ",\n  " + ",\n  ".join(constraints)
+                elements.write(_PK_STORAGE)
         
-        # Add storage parameters if requested
-        if include_storage:
-            create_stmt += f"\n)\nTABLESPACE USERS PCTFREE 10 PCTUSED 40 INITRANS 1 MAXTRANS 255 \nNOLOGGING STORAGE(INITIAL 65536 NEXT 1048576 MINEXTENTS 1 MAXEXTENTS 2147483645\nPCTINCREASE 0 FREELISTS 1 FREELIST GROUPS 1\nBUFFER_POOL DEFAULT FLASH_CACHE DEFAULT CELL_FLASH_CACHE DEFAULT)"
-        else:
-            create_stmt += "\n)"
-        
-        create_stmt += ";"
-        return create_stmt
+        # Build the complete CREATE TABLE statement, adding storage parameters if requested
+        return _CREATE_TABLE_TMPL.substitute(
+            table=table_name,
+            elements=elements.getvalue(),
+            tail=_TABLE_STORAGE if include_storage else "\n)",
+        )
     
-    def _generate_common_oracle_tables(self) -> List[List[Dict[str, Any]]]:
-        """Generate common Oracle database table structures."""
-        tables = []
-        
-        # Employees table
-        employees = [
-            {'table': 'EMPLOYEES', 'name': 'EMPLOYEE_ID', 'type': 'NUMBER(6)', 'constraints': 'PRIMARY KEY'},
-            {'table': 'EMPLOYEES', 'name': 'FIRST_NAME', 'type': 'VARCHAR2(20)'},
-            {'table': 'EMPLOYEES', 'name': 'LAST_NAME', 'type': 'VARCHAR2(25)', 'constraints': 'NOT NULL'},
-            {'table': 'EMPLOYEES', 'name': 'FIRST_NAME_JP', 'type': 'VARCHAR2(20)'},
-            {'table': 'EMPLOYEES', 'name': 'LAST_NAME_JP', 'type': 'VARCHAR2(25)'},
-            {'table': 'EMPLOYEES', 'name': 'EMAIL', 'type': 'VARCHAR2(25)', 'constraints': 'UNIQUE'},
-            {'table': 'EMPLOYEES', 'name': 'PHONE_NUMBER', 'type': 'VARCHAR2(20)'},
-            {'table': 'EMPLOYEES', 'name': 'HIRE_DATE', 'type': 'DATE', 'constraints': 'NOT NULL'},
-            {'table': 'EMPLOYEES', 'name': 'JOB_ID', 'type': 'VARCHAR2(10)', 'constraints': 'NOT NULL'},
-            {'table': 'EMPLOYEES', 'name': 'SALARY', 'type': 'NUMBER(8,2)'},
-            {'table': 'EMPLOYEES', 'name': 'COMMISSION_PCT', 'type': 'NUMBER(2,2)'},
-            {'table': 'EMPLOYEES', 'name': 'MANAGER_ID', 'type': 'NUMBER(6)'},
-            {'table': 'EMPLOYEES', 'name': 'DEPARTMENT_ID', 'type': 'NUMBER(4)'},
-            {'table': 'EMPLOYEES', 'name': 'NOTES_JP', 'type': 'CLOB'}
-        ]
-        tables.append(employees)
-        
-        # Departments table
-        departments = [
-            {'table': 'DEPARTMENTS', 'name': 'DEPARTMENT_ID', 'type': 'NUMBER(4)', 'constraints': 'PRIMARY KEY'},
-            {'table': 'DEPARTMENTS', 'name': 'DEPARTMENT_NAME', 'type': 'VARCHAR2(30)', 'constraints': 'NOT NULL'},
-            {'table': 'DEPARTMENTS', 'name': 'DEPARTMENT_NAME_JP', 'type': 'VARCHAR2(30)'},
-            {'table': 'DEPARTMENTS', 'name': 'MANAGER_ID', 'type': 'NUMBER(6)'},
-            {'table': 'DEPARTMENTS', 'name': 'LOCATION_ID', 'type': 'NUMBER(4)'},
-            {'table': 'DEPARTMENTS', 'name': 'DESCRIPTION_JP', 'type': 'CLOB'}
-        ]
-        tables.append(departments)
-        
-        # Jobs table
-        jobs = [
-            {'table': 'JOBS', 'name': 'JOB_ID', 'type': 'VARCHAR2(10)', 'constraints': 'PRIMARY KEY'},
-            {'table': 'JOBS', 'name': 'JOB_TITLE', 'type': 'VARCHAR2(35)', 'constraints': 'NOT NULL'},
-            {'table': 'JOBS', 'name': 'JOB_TITLE_JP', 'type': 'VARCHAR2(35)'},
-            {'table': 'JOBS', 'name': 'MIN_SALARY', 'type': 'NUMBER(6)'},
-            {'table': 'JOBS', 'name': 'MAX_SALARY', 'type': 'NUMBER(6)'},
-            {'table': 'JOBS', 'name': 'JOB_DESCRIPTION', 'type': 'CLOB'},
-            {'table': 'JOBS', 'name': 'JOB_DESCRIPTION_JP', 'type': 'CLOB'}
-        ]
-        tables.append(jobs)
+    def _generate_common_oracle_tables(self) -> Tuple[_TableStructure, ...]:
+        """Get the common Oracle database table structures."""
+        return _COMMON_TABLES
         
-        # Locations table
-        locations = [
-            {'table': 'LOCATIONS', 'name': 'LOCATION_ID', 'type': 'NUMBER(4)', 'constraints': 'PRIMARY KEY'},
-            {'table': 'LOCATIONS', 'name': 'STREET_ADDRESS', 'type': 'VARCHAR2(40)'},
-            {'table': 'LOCATIONS', 'name': 'STREET_ADDRESS_JP', 'type': 'VARCHAR2(40)'},
-            {'table': 'LOCATIONS', 'name': 'POSTAL_CODE', 'type': 'VARCHAR2(12)'},
-            {'table': 'LOCATIONS', 'name': 'CITY', 'type': 'VARCHAR2(30)', 'constraints': 'NOT NULL'},
-            {'table': 'LOCATIONS', 'name': 'CITY_JP', 'type': 'VARCHAR2(30)'},
-            {'table': 'LOCATIONS', 'name': 'STATE_PROVINCE', 'type': 'VARCHAR2(25)'},
-            {'table': 'LOCATIONS', 'name': 'STATE_PROVINCE_JP', 'type': 'VARCHAR2(25)'},
-            {'table': 'LOCATIONS', 'name': 'COUNTRY_ID', 'type': 'CHAR(2)'}
-        ]
-        tables.append(locations)
-        
-        # Products table
-        products = [
-            {'table': 'PRODUCTS', 'name': 'PRODUCT_ID', 'type': 'NUMBER(6)', 'constraints': 'PRIMARY KEY'},
-            {'table': 'PRODUCTS', 'name': 'PRODUCT_NAME', 'type': 'VARCHAR2(50)', 'constraints': 'NOT NULL'},
-            {'table': 'PRODUCTS', 'name': 'PRODUCT_NAME_JP', 'type': 'VARCHAR2(50)'},
-            {'table': 'PRODUCTS', 'name': 'DESCRIPTION', 'type': 'VARCHAR2(2000)'},
-            {'table': 'PRODUCTS', 'name': 'DESCRIPTION_JP', 'type': 'VARCHAR2(2000)'},
-            {'table': 'PRODUCTS', 'name': 'CATEGORY_ID', 'type': 'NUMBER(4)'},
-            {'table': 'PRODUCTS', 'name': 'STANDARD_COST', 'type': 'NUMBER(9,2)'},
-            {'table': 'PRODUCTS', 'name': 'LIST_PRICE', 'type': 'NUMBER(9,2)'},
-            {'table': 'PRODUCTS', 'name': 'CREATED_DATE', 'type': 'DATE'},
-            {'table': 'PRODUCTS', 'name': 'MODIFIED_DATE', 'type': 'DATE'}
-        ]
-        tables.append(products)
-        
-        # Customers table
-        customers = [
-            {'table': 'CUSTOMERS', 'name': 'CUSTOMER_ID', 'type': 'NUMBER(6)', 'constraints': 'PRIMARY KEY'},
-            {'table': 'CUSTOMERS', 'name': 'FIRST_NAME', 'type': 'VARCHAR2(20)'},
-            {'table': 'CUSTOMERS', 'name': 'LAST_NAME', 'type': 'VARCHAR2(25)', 'constraints': 'NOT NULL'},
-            {'table': 'CUSTOMERS', 'name': 'FIRST_NAME_JP', 'type': 'VARCHAR2(20)'},
-            {'table': 'CUSTOMERS', 'name': 'LAST_NAME_JP', 'type': 'VARCHAR2(25)'},
-            {'table': 'CUSTOMERS', 'name': 'EMAIL', 'type': 'VARCHAR2(50)', 'constraints': 'UNIQUE'},
-            {'table': 'CUSTOMERS', 'name': 'PHONE', 'type': 'VARCHAR2(20)'},
-            {'table': 'CUSTOMERS', 'name': 'ADDRESS', 'type': 'VARCHAR2(100)'},
-            {'table': 'CUSTOMERS', 'name': 'ADDRESS_JP', 'type': 'VARCHAR2(100)'},
-            {'table': 'CUSTOMERS', 'name': 'CITY', 'type': 'VARCHAR2(30)'},
-            {'table': 'CUSTOMERS', 'name': 'CITY_JP', 'type': 'VARCHAR2(30)'},
-            {'table': 'CUSTOMERS', 'name': 'STATE', 'type': 'VARCHAR2(20)'},
-            {'table': 'CUSTOMERS', 'name': 'STATE_JP', 'type': 'VARCHAR2(20)'},
-            {'table': 'CUSTOMERS', 'name': 'POSTAL_CODE', 'type': 'VARCHAR2(10)'},
-            {'table': 'CUSTOMERS', 'name': 'COUNTRY', 'type': 'VARCHAR2(20)'},
-            {'table': 'CUSTOMERS', 'name': 'COUNTRY_JP', 'type': 'VARCHAR2(20)'},
-            {'table': 'CUSTOMERS', 'name': 'CREDIT_LIMIT', 'type': 'NUMBER(9,2)'},
-            {'table': 'CUSTOMERS', 'name': 'REGISTRATION_DATE', 'type': 'DATE'}
-        ]
-        tables.append(customers)
-        
-        # Orders table (additional table for relationships)
-        orders = [
-            {'table': 'ORDERS', 'name': 'ORDER_ID', 'type': 'NUMBER(12)', 'constraints': 'PRIMARY KEY'},
-            {'table': 'ORDERS', 'name': 'CUSTOMER_ID', 'type': 'NUMBER(6)', 'constraints': 'NOT NULL'},
-            {'table': 'ORDERS', 'name': 'STATUS', 'type': 'VARCHAR2(20)', 'constraints': 'NOT NULL'},
-            {'table': 'ORDERS', 'name': 'SALESPERSON_ID', 'type': 'NUMBER(6)'},
-            {'table': 'ORDERS', 'name': 'ORDER_DATE', 'type': 'DATE', 'constraints': 'NOT NULL'},
-            {'table': 'ORDERS', 'name': 'SHIPPING_DATE', 'type': 'DATE'},
-            {'table': 'ORDERS', 'name': 'SHIPPING_ADDRESS', 'type': 'VARCHAR2(255)'},
-            {'table': 'ORDERS', 'name': 'SHIPPING_ADDRESS_JP', 'type': 'VARCHAR2(255)'},
-            {'table': 'ORDERS', 'name': 'SHIPPING_CITY', 'type': 'VARCHAR2(30)'},
-            {'table': 'ORDERS', 'name': 'SHIPPING_CITY_JP', 'type': 'VARCHAR2(30)'},
-            {'table': 'ORDERS', 'name': 'SHIPPING_STATE', 'type': 'VARCHAR2(20)'},
-            {'table': 'ORDERS', 'name': 'SHIPPING_ZIP', 'type': 'VARCHAR2(10)'},
-            {'table': 'ORDERS', 'name': 'SHIPPING_COUNTRY', 'type': 'VARCHAR2(20)'},
-            {'table': 'ORDERS', 'name': 'PAYMENT_METHOD', 'type': 'VARCHAR2(20)'},
-            {'table': 'ORDERS', 'name': 'ORDER_TOTAL', 'type': 'NUMBER(10,2)'},
-            {'table': 'ORDERS', 'name': 'NOTES', 'type': 'CLOB'},
-            {'table': 'ORDERS', 'name': 'NOTES_JP', 'type': 'CLOB'}
-        ]
-        tables.append(orders)
-        
-        # Order Items table
-        order_items = [
-            {'table': 'ORDER_ITEMS', 'name': 'ORDER_ID', 'type': 'NUMBER(12)', 'constraints': 'NOT NULL'},
-            {'table': 'ORDER_ITEMS', 'name': 'PRODUCT_ID', 'type': 'NUMBER(6)', 'constraints': 'NOT NULL'},
-            {'table': 'ORDER_ITEMS', 'name': 'UNIT_PRICE', 'type': 'NUMBER(10,2)', 'constraints': 'NOT NULL'},
-            {'table': 'ORDER_ITEMS', 'name': 'QUANTITY', 'type': 'NUMBER(8)', 'constraints': 'NOT NULL'},
-            {'table': 'ORDER_ITEMS', 'name': 'DISCOUNT_PERCENT', 'type': 'NUMBER(4,2)'},
-            {'table': 'ORDER_ITEMS', 'name': 'LINE_TOTAL', 'type': 'NUMBER(10,2)'},
-            {'table': 'ORDER_ITEMS', 'name': 'NOTES', 'type': 'VARCHAR2(500)'},
-            {'table': 'ORDER_ITEMS', 'name': 'NOTES_JP', 'type': 'VARCHAR2(500)'}
-        ]
-        tables.append(order_items)
-        
-        return tables
-        
-    def _generate_indexes_and_constraints(self, include_storage: bool = True) -> None:
-        """Generate indexes and constraints for tables"""
-        # Generate unique indexes for unique constraints
-        for table_info in self.tables:
-            table_name = table_info.name
-            for col in table_info.columns:
-                if 'constraints' in col and 'UNIQUE' in col['constraints']:
-                    idx_name = f"{table_name}_{col['name']}_UK"
-                    
-                    # Create index object
-                    index_obj = OracleObject(idx_name, "INDEX")
-                    storage_clause = ""
-                    if include_storage:
-                        storage_clause = """
-TABLESPACE USERS PCTFREE 10 INITRANS 2 MAXTRANS 255 COMPUTE STATISTICS
-STORAGE(INITIAL 65536 NEXT 1048576 MINEXTENTS 1 MAXEXTENTS 2147483645
-PCTINCREASE 0 FREELISTS 1 FREELIST GROUPS 1
-BUFFER_POOL DEFAULT FLASH_CACHE DEFAULT CELL_FLASH_CACHE DEFAULT)"""
-                    
-                    index_obj.sql = f"""-- Unique Index for {col['name']} column
-CREATE UNIQUE INDEX {idx_name} ON {table_name}({col['name']}){storage_clause};"""
-                    index_obj.add_dependency(table_name)
-                    self.objects.append(index_obj)
-        
-        # Generate foreign key constraints
-        constraint_obj = OracleObject("FOREIGN_KEYS", "CONSTRAINT")
-        constraint_obj.sql = """-- Foreign Key Constraints
-ALTER TABLE EMPLOYEES ADD CONSTRAINT EMP_DEPT_FK
-  FOREIGN KEY (DEPARTMENT_ID) REFERENCES DEPARTMENTS (DEPARTMENT_ID)
-  ENABLE VALIDATE;
-  
-ALTER TABLE EMPLOYEES ADD CONSTRAINT EMP_JOB_FK
-  FOREIGN KEY (JOB_ID) REFERENCES JOBS (JOB_ID)
-  ENABLE VALIDATE;
-
-ALTER TABLE EMPLOYEES ADD CONSTRAINT EMP_MANAGER_FK
-  FOREIGN KEY (MANAGER_ID) REFERENCES EMPLOYEES (EMPLOYEE_ID)
-  ENABLE VALIDATE;
-  
-ALTER TABLE DEPARTMENTS ADD CONSTRAINT DEPT_MGR_FK
-  FOREIGN KEY (MANAGER_ID) REFERENCES EMPLOYEES (EMPLOYEE_ID)
-  ENABLE VALIDATE;
-  
-ALTER TABLE DEPARTMENTS ADD CONSTRAINT DEPT_LOC_FK
-  FOREIGN KEY (LOCATION_ID) REFERENCES LOCATIONS (LOCATION_ID)
-  ENABLE VALIDATE;
-
-ALTER TABLE ORDERS ADD CONSTRAINT ORD_CUST_FK
-  FOREIGN KEY (CUSTOMER_ID) REFERENCES CUSTOMERS (CUSTOMER_ID)
-  ENABLE VALIDATE;
-  
-ALTER TABLE ORDERS ADD CONSTRAINT ORD_EMP_FK
-  FOREIGN KEY (SALESPERSON_ID) REFERENCES EMPLOYEES (EMPLOYEE_ID)
-  ENABLE VALIDATE;
-  
-ALTER TABLE ORDER_ITEMS ADD CONSTRAINT ORDITM_ORD_FK
-  FOREIGN KEY (ORDER_ID) REFERENCES ORDERS (ORDER_ID)
-  ENABLE VALIDATE;
-  
-ALTER TABLE ORDER_ITEMS ADD CONSTRAINT ORDITM_PROD_FK
-  FOREIGN KEY (PRODUCT_ID) REFERENCES PRODUCTS (PRODUCT_ID)
-  ENABLE VALIDATE;"""
-        constraint_obj.add_dependency("EMPLOYEES")
-        constraint_obj.add_dependency("DEPARTMENTS")
-        constraint_obj.add_dependency("JOBS")
-        constraint_obj.add_dependency("LOCATIONS")
-        constraint_obj.add_dependency("ORDERS")
-        constraint_obj.add_dependency("ORDER_ITEMS")
-        constraint_obj.add_dependency("PRODUCTS")
-        constraint_obj.add_dependency("CUSTOMERS")
-        self.objects.append(constraint_obj)
-        
-        # Add check constraints
-        check_obj = OracleObject("CHECK_CONSTRAINTS", "CONSTRAINT")
-        check_obj.sql = """-- Check Constraints
-ALTER TABLE EMPLOYEES ADD CONSTRAINT EMP_SALARY_MIN
-  CHECK (SALARY > 0) ENABLE VALIDATE;
-  
-ALTER TABLE JOBS ADD CONSTRAINT JOB_SALARY_RANGE
-  CHECK (MIN_SALARY < MAX_SALARY) ENABLE VALIDATE;
-  
-ALTER TABLE ORDER_ITEMS ADD CONSTRAINT ORDITM_QTY_MIN
-  CHECK (QUANTITY > 0) ENABLE VALIDATE;
-  
-ALTER TABLE PRODUCTS ADD CONSTRAINT PROD_PRICE_MIN
-  CHECK (LIST_PRICE >= 0) ENABLE VALIDATE;"""
-        check_obj.add_dependency("EMPLOYEES")
-        check_obj.add_dependency("JOBS")
-        check_obj.add_dependency("ORDER_ITEMS")
-        check_obj.add_dependency("PRODUCTS")
-        self.objects.append(check_obj)
-        
-    def _generate_sequences(self) -> None:
-        """Generate sequences for tables"""
-        seq_obj = OracleObject("SEQUENCES", "SEQUENCE")
-        seq_obj.sql = """-- Sequences for primary key generation
-CREATE SEQUENCE EMPLOYEES_SEQ
-  START WITH 1000
-  INCREMENT BY 1
-  NOCACHE
-  NOCYCLE;
-
-CREATE SEQUENCE DEPARTMENTS_SEQ
-  START WITH 100
-  INCREMENT BY 10
-  NOCACHE
-  NOCYCLE;
-
-CREATE SEQUENCE LOCATIONS_SEQ
-  START WITH 1000
-  INCREMENT BY 100
-  NOCACHE
-  NOCYCLE;
-
-CREATE SEQUENCE PRODUCTS_SEQ
-  START WITH 10000
-  INCREMENT BY 1
-  NOCACHE
-  NOCYCLE;
-
-CREATE SEQUENCE CUSTOMERS_SEQ
-  START WITH 1
-  INCREMENT BY 1
-  NOCACHE
-  NOCYCLE;
-  
-CREATE SEQUENCE ORDERS_SEQ
-  START WITH 10000
-  INCREMENT BY 1
-  NOCACHE
-  NOCYCLE;"""
-        self.objects.append(seq_obj)
-    
-    def _generate_comments(self) -> None:
-        """Generate comments for tables and columns"""
-        comment_obj = OracleObject("COMMENTS", "COMMENT")
-        comment_obj.sql = """-- Table and Column Comments
-COMMENT ON TABLE EMPLOYEES IS 'Contains employee information including Japanese name fields';
-COMMENT ON COLUMN EMPLOYEES.EMPLOYEE_ID IS 'Primary key of employees table';
-COMMENT ON COLUMN EMPLOYEES.FIRST_NAME_JP IS 'First name in Japanese';
-COMMENT ON COLUMN EMPLOYEES.LAST_NAME_JP IS 'Last name in Japanese';
-COMMENT ON COLUMN EMPLOYEES.HIRE_DATE IS 'Date when the employee was hired';
-
-COMMENT ON TABLE DEPARTMENTS IS 'Contains department information';
-COMMENT ON COLUMN DEPARTMENTS.DEPARTMENT_NAME_JP IS 'Department name in Japanese';
-
-COMMENT ON TABLE JOBS IS 'Contains job information including salary ranges';
-COMMENT ON COLUMN JOBS.JOB_TITLE_JP IS 'Job title in Japanese';
-
-COMMENT ON TABLE CUSTOMERS IS 'Customer information table';
-COMMENT ON COLUMN CUSTOMERS.FIRST_NAME_JP IS 'Customer first name in Japanese';
-COMMENT ON COLUMN CUSTOMERS.LAST_NAME_JP IS 'Customer last name in Japanese';
-
-COMMENT ON TABLE ORDERS IS 'Order header information';
-COMMENT ON COLUMN ORDERS.SHIPPING_ADDRESS_JP IS 'Shipping address in Japanese';
-
-COMMENT ON TABLE ORDER_ITEMS IS 'Order line items';
-COMMENT ON COLUMN ORDER_ITEMS.NOTES_JP IS 'Item notes in Japanese';"""
-        comment_obj.add_dependency("EMPLOYEES")
-        comment_obj.add_dependency("DEPARTMENTS")
-        comment_obj.add_dependency("JOBS")
-        comment_obj.add_dependency("CUSTOMERS")
-        comment_obj.add_dependency("ORDERS")
-        comment_obj.add_dependency("ORDER_ITEMS")
-        self.objects.append(comment_obj)
+    @staticmethod
+    def _generate_unique_indexes(table_name: str, columns: Sequence[Column],
+                                 include_storage: bool = True) -> Tuple[_ObjectRecord, ...]:
+        """Generate unique indexes for the unique constraints of a table"""
+        storage_clause = _INDEX_STORAGE if include_storage else ""
+        records: List[_ObjectRecord] = []
+        for col in columns:
+            if 'UNIQUE' in col.constraints:
+                idx_name = f"{table_name}_{col.name}_UK"
+                sql = f"""-- Unique Index for {col.name} column
+CREATE UNIQUE INDEX {idx_name} ON {table_name}({col.name}){storage_clause};"""
+                records.append((idx_name, "INDEX", sql, (table_name,)))
+        return tuple(records)
     
     def get_tables(self) -> List[TableInfo]:
         """Get the list of tables"""
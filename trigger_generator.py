@@ -10,49 +10,51 @@ and compound triggers.
 Author: John Clark Naldoza
 """
 
-import random
-from typing import List, Dict, Any
-from core import OracleObjectGenerator, OracleObject, TableInfo
+from __future__ import annotations
 
-class TriggerGenerator(OracleObjectGenerator):
-    """
-    Generates Oracle trigger objects
-    """
-    def __init__(self):
-        super().__init__()
-        
-    def generate(self, tables: List[TableInfo], **kwargs) -> List[OracleObject]:
-        """Generate Oracle triggers for tables"""
-        # Generate various types of triggers for the tables
-        for table_info in tables:
-            table_name = table_info.name
-            
-            # Skip ORDER_ITEMS table for triggers as it's a child table
-            if table_name == 'ORDER_ITEMS':
-                continue
-                
-            # Generate different types of triggers based on table
-            if table_name == 'EMPLOYEES':
-                self._generate_employee_triggers(table_info)
-            elif table_name == 'DEPARTMENTS':
-                self._generate_department_triggers(table_info)
-            elif table_name == 'ORDERS':
-                self._generate_order_triggers(table_info)
-            elif table_name == 'PRODUCTS':
-                self._generate_product_triggers(table_info)
-            elif table_name == 'CUSTOMERS':
-                self._generate_customer_triggers(table_info)
-        
-        # Generate system event triggers
-        self._generate_system_event_triggers()
-        
-        return self.objects
-        
-    def _generate_employee_triggers(self, table_info: TableInfo) -> None:
-        """Generate triggers for the EMPLOYEES table"""
-        # Compound trigger for salary validation and audit
-        compound_trigger = OracleObject("EMPLOYEES_SALARY_CHK_TRG", "TRIGGER")
-        compound_trigger.sql = f"""-- Compound trigger to validate salary changes and maintain audit history
+import string
+import sys
+from collections.abc import Callable
+from functools import lru_cache
+from core import OracleObjectGenerator, OracleObject, TableInfo, join_sql_script
+
+# Names of the tables that get triggers or are referenced by them
+_EMPLOYEES = sys.intern("EMPLOYEES")
+_DEPARTMENTS = sys.intern("DEPARTMENTS")
+_ORDERS = sys.intern("ORDERS")
+_ORDER_ITEMS = sys.intern("ORDER_ITEMS")
+_PRODUCTS = sys.intern("PRODUCTS")
+_CUSTOMERS = sys.intern("CUSTOMERS")
+
+# Largest salary raise in percent accepted by EMPLOYEES_SALARY_CHK_TRG
+_MAX_SALARY_INCREASE_PCT = 20
+
+# Order status transitions enforced by ORDERS_STATUS_CHK_TRG
+_ORDER_STATUS_TRANSITIONS: tuple[tuple[str, tuple[str, ...]], ...] = (
+    ('PENDING', ('PROCESSING', 'CANCELLED')),
+    ('PROCESSING', ('SHIPPED', 'CANCELLED')),
+    ('SHIPPED', ('DELIVERED', 'RETURNED')),
+    ('DELIVERED', ('RETURNED', 'COMPLETED')),
+    ('RETURNED', ('REFUNDED', 'RESTOCKED')),
+    ('CANCELLED', ()),
+    ('COMPLETED', ()),
+    ('REFUNDED', ()),
+    ('RESTOCKED', ()),
+)
+
+def _audit_time(variable: str) -> str:
+    """PL/SQL expression formatting a timestamp variable for an audit line"""
+    return f"TO_CHAR({variable}, 'YYYY-MM-DD HH24:MI:SS.FF')"
+
+def _audit_put_line(*parts: str, indent: str = "  ") -> str:
+    """PL/SQL call printing an audit line concatenated from the given parts, one per line"""
+    return (f"{indent}DBMS_OUTPUT.PUT_LINE(\n{indent}  "
+            + f" ||\n{indent}  ".join(parts)
+            + f"\n{indent});")
+
+# Trigger bodies take no runtime values, so they are module constants. The
+# parameterized ones are templates rendered once, when a trigger's SQL is first read.
+_EMPLOYEES_SALARY_CHK_TRG_TMPL = string.Template("""-- Compound trigger to validate salary changes and maintain audit history
 CREATE OR REPLACE TRIGGER EMPLOYEES_SALARY_CHK_TRG
 FOR UPDATE OF SALARY ON EMPLOYEES
 COMPOUND TRIGGER
@@ -71,7 +73,7 @@ COMPOUND TRIGGER
   l_idx PLS_INTEGER := 0;
   
   -- Constants
-  MAX_SALARY_INCREASE CONSTANT NUMBER := 20; -- Maximum 20% increase allowed
+  MAX_SALARY_INCREASE CONSTANT NUMBER := $max_salary_increase; -- Maximum $max_salary_increase% increase allowed
   
   -- Before statement section
   BEFORE STATEMENT IS
@@ -116,23 +118,25 @@ COMPOUND TRIGGER
     FOR i IN 1..l_changes.COUNT LOOP
       -- For simplicity, we're just printing what would be inserted
       -- In real implementation, this would insert to an audit table
-      DBMS_OUTPUT.PUT_LINE(
-        'AUDIT: Employee ' || l_changes(i).employee_id || 
-        ' salary changed from ' || l_changes(i).old_salary || 
-        ' to ' || l_changes(i).new_salary || 
-        ' (' || l_changes(i).change_pct || '%)' ||
-        ' by ' || l_changes(i).changed_by
-      );
+$audit_line
     END LOOP;
   END AFTER STATEMENT;
 END EMPLOYEES_SALARY_CHK_TRG;
-/"""
-        compound_trigger.add_dependency("EMPLOYEES")
-        self.objects.append(compound_trigger)
-        
-        # Row-level trigger for employee email standardization
-        email_trigger = OracleObject("EMPLOYEES_EMAIL_TRG", "TRIGGER")
-        email_trigger.sql = f"""-- Row-level trigger to standardize email format
+/""")
+
+@lru_cache(maxsize=None)
+def _employees_salary_chk_trg_sql() -> str:
+    """Render EMPLOYEES_SALARY_CHK_TRG from its template"""
+    return _EMPLOYEES_SALARY_CHK_TRG_TMPL.substitute(
+        max_salary_increase=_MAX_SALARY_INCREASE_PCT,
+        audit_line=_audit_put_line("'AUDIT: Employee ' || l_changes(i).employee_id",
+                                   "' salary changed from ' || l_changes(i).old_salary",
+                                   "' to ' || l_changes(i).new_salary",
+                                   "' (' || l_changes(i).change_pct || '%)'",
+                                   "' by ' || l_changes(i).changed_by",
+                                   indent="      "))
+
+_EMPLOYEES_EMAIL_TRG_SQL = """-- Row-level trigger to standardize email format
 CREATE OR REPLACE TRIGGER EMPLOYEES_EMAIL_TRG
 BEFORE INSERT OR UPDATE OF EMAIL ON EMPLOYEES
 FOR EACH ROW
@@ -148,14 +152,8 @@ BEGIN
   END IF;
 END;
 /"""
-        email_trigger.add_dependency("EMPLOYEES")
-        self.objects.append(email_trigger)
-        
-    def _generate_department_triggers(self, table_info: TableInfo) -> None:
-        """Generate triggers for the DEPARTMENTS table"""
-        # Before insert/update trigger for departments
-        dept_trigger = OracleObject("DEPARTMENTS_BIU_TRG", "TRIGGER")
-        dept_trigger.sql = f"""-- Trigger to enforce department name uniqueness and standardization
+
+_DEPARTMENTS_BIU_TRG_SQL = """-- Trigger to enforce department name uniqueness and standardization
 CREATE OR REPLACE TRIGGER DEPARTMENTS_BIU_TRG
 BEFORE INSERT OR UPDATE ON DEPARTMENTS
 FOR EACH ROW
@@ -190,12 +188,8 @@ BEGIN
   :NEW.MODIFIED_DATE := SYSDATE;
 END;
 /"""
-        dept_trigger.add_dependency("DEPARTMENTS")
-        self.objects.append(dept_trigger)
-        
-        # Statement-level audit trigger
-        audit_trigger = OracleObject("DEPARTMENTS_AUDIT_TRG", "TRIGGER")
-        audit_trigger.sql = f"""-- Statement-level trigger for auditing department changes
+
+_DEPARTMENTS_AUDIT_TRG_SQL = string.Template("""-- Statement-level trigger for auditing department changes
 CREATE OR REPLACE TRIGGER DEPARTMENTS_AUDIT_TRG
 AFTER INSERT OR UPDATE OR DELETE ON DEPARTMENTS
 DECLARE
@@ -215,25 +209,17 @@ BEGIN
   l_time := SYSTIMESTAMP;
   
   -- Log audit information (to output for this example)
-  DBMS_OUTPUT.PUT_LINE(
-    'AUDIT: ' || l_operation || ' operation on DEPARTMENTS at ' || 
-    TO_CHAR(l_time, 'YYYY-MM-DD HH24:MI:SS.FF') || 
-    ' by user ' || l_user
-  );
+$audit_line
   
   -- In a real system, this would insert into an audit table:
   -- INSERT INTO AUDIT_LOG (TABLE_NAME, OPERATION, USER_NAME, LOG_TIME)
   -- VALUES ('DEPARTMENTS', l_operation, l_user, l_time);
 END;
-/"""
-        audit_trigger.add_dependency("DEPARTMENTS")
-        self.objects.append(audit_trigger)
-        
-    def _generate_order_triggers(self, table_info: TableInfo) -> None:
-        """Generate triggers for the ORDERS table"""
-        # Trigger to calculate order total from items
-        order_total_trigger = OracleObject("ORDERS_UPD_TOTAL_TRG", "TRIGGER")
-        order_total_trigger.sql = f"""-- Trigger to update order total when items change
+/""").substitute(audit_line=_audit_put_line("'AUDIT: ' || l_operation || ' operation on DEPARTMENTS at '",
+                                            _audit_time("l_time"),
+                                            "' by user ' || l_user"))
+
+_ORDERS_UPD_TOTAL_TRG_SQL = """-- Trigger to update order total when items change
 CREATE OR REPLACE TRIGGER ORDERS_UPD_TOTAL_TRG
 AFTER INSERT OR UPDATE OR DELETE ON ORDER_ITEMS
 FOR EACH ROW
@@ -257,41 +243,26 @@ BEGIN
   WHERE ORDER_ID = l_order_id;
 END;
 /"""
-        order_total_trigger.add_dependency("ORDERS")
-        order_total_trigger.add_dependency("ORDER_ITEMS")
-        self.objects.append(order_total_trigger)
-        
-        # Status change validation trigger
-        status_trigger = OracleObject("ORDERS_STATUS_CHK_TRG", "TRIGGER")
-        status_trigger.sql = f"""-- Trigger to validate order status changes
+
+_ORDERS_STATUS_CHK_TRG_TMPL = string.Template("""-- Trigger to validate order status changes
 CREATE OR REPLACE TRIGGER ORDERS_STATUS_CHK_TRG
 BEFORE UPDATE OF STATUS ON ORDERS
 FOR EACH ROW
 DECLARE
-  TYPE status_transition_t IS TABLE OF VARCHAR2(20) INDEX BY VARCHAR2(20);
-  l_valid_transitions status_transition_t;
+  -- Valid next statuses of the old status; final statuses have none
+  l_next_statuses VARCHAR2(100) := CASE :OLD.STATUS
+$next_statuses
+  END;
 BEGIN
-  -- Define valid status transitions
-  l_valid_transitions('PENDING') := 'PROCESSING,CANCELLED';
-  l_valid_transitions('PROCESSING') := 'SHIPPED,CANCELLED';
-  l_valid_transitions('SHIPPED') := 'DELIVERED,RETURNED';
-  l_valid_transitions('DELIVERED') := 'RETURNED,COMPLETED';
-  l_valid_transitions('RETURNED') := 'REFUNDED,RESTOCKED';
-  l_valid_transitions('CANCELLED') := '';
-  l_valid_transitions('COMPLETED') := '';
-  l_valid_transitions('REFUNDED') := '';
-  l_valid_transitions('RESTOCKED') := '';
-  
   -- Check if new status is different
   IF :NEW.STATUS != :OLD.STATUS THEN
     -- Verify the transition is valid
-    IF :OLD.STATUS IS NOT NULL AND 
-       l_valid_transitions.EXISTS(:OLD.STATUS) AND
-       INSTR(',' || l_valid_transitions(:OLD.STATUS) || ',', ',' || :NEW.STATUS || ',') = 0 
+    IF :OLD.STATUS IN ($known_statuses) AND
+       INSTR(',' || l_next_statuses || ',', ',' || :NEW.STATUS || ',') = 0 
     THEN
       RAISE_APPLICATION_ERROR(-20003, 
         'Invalid status transition from "' || :OLD.STATUS || '" to "' || :NEW.STATUS || '". ' ||
-        'Valid next statuses are: ' || NVL(l_valid_transitions(:OLD.STATUS), 'NONE'));
+        'Valid next statuses are: ' || NVL(l_next_statuses, 'NONE'));
     END IF;
     
     -- Auto-update shipping date when status changes to SHIPPED
@@ -300,15 +271,17 @@ BEGIN
     END IF;
   END IF;
 END;
-/"""
-        status_trigger.add_dependency("ORDERS")
-        self.objects.append(status_trigger)
-        
-    def _generate_product_triggers(self, table_info: TableInfo) -> None:
-        """Generate triggers for the PRODUCTS table"""
-        # Price change notification trigger
-        price_trigger = OracleObject("PRODUCTS_PRICE_TRG", "TRIGGER")
-        price_trigger.sql = f"""-- Trigger to track product price changes and notify key customers
+/""")
+
+@lru_cache(maxsize=None)
+def _orders_status_chk_trg_sql() -> str:
+    """Render ORDERS_STATUS_CHK_TRG from its template"""
+    return _ORDERS_STATUS_CHK_TRG_TMPL.substitute(
+        next_statuses="\n".join(f"    WHEN '{status}' THEN '{','.join(next_statuses)}'"
+                                 for status, next_statuses in _ORDER_STATUS_TRANSITIONS if next_statuses),
+        known_statuses=", ".join(f"'{status}'" for status, _ in _ORDER_STATUS_TRANSITIONS))
+
+_PRODUCTS_PRICE_TRG_SQL = """-- Trigger to track product price changes and notify key customers
 CREATE OR REPLACE TRIGGER PRODUCTS_PRICE_TRG
 AFTER UPDATE OF LIST_PRICE ON PRODUCTS
 FOR EACH ROW
@@ -364,14 +337,8 @@ BEGIN
   :NEW.MODIFIED_DATE := SYSDATE;
 END;
 /"""
-        price_trigger.add_dependency("PRODUCTS")
-        self.objects.append(price_trigger)
-        
-    def _generate_customer_triggers(self, table_info: TableInfo) -> None:
-        """Generate triggers for the CUSTOMERS table"""
-        # Customer data normalization trigger
-        customer_trigger = OracleObject("CUSTOMERS_NORM_TRG", "TRIGGER")
-        customer_trigger.sql = f"""-- Trigger to normalize customer data
+
+_CUSTOMERS_NORM_TRG_SQL = """-- Trigger to normalize customer data
 CREATE OR REPLACE TRIGGER CUSTOMERS_NORM_TRG
 BEFORE INSERT OR UPDATE ON CUSTOMERS
 FOR EACH ROW
@@ -413,14 +380,8 @@ BEGIN
   END IF;
 END;
 /"""
-        customer_trigger.add_dependency("CUSTOMERS")
-        self.objects.append(customer_trigger)
-        
-    def _generate_system_event_triggers(self) -> None:
-        """Generate system event triggers"""
-        # DDL audit trigger
-        ddl_trigger = OracleObject("AUDIT_DDL_TRG", "TRIGGER")
-        ddl_trigger.sql = f"""-- System trigger to audit DDL operations
+
+_AUDIT_DDL_TRG_SQL = string.Template("""-- System trigger to audit DDL operations
 CREATE OR REPLACE TRIGGER AUDIT_DDL_TRG
 AFTER DDL ON DATABASE
 DECLARE
@@ -432,12 +393,7 @@ DECLARE
   l_timestamp TIMESTAMP := SYSTIMESTAMP;
 BEGIN
   -- Log DDL event (to output for this example)
-  DBMS_OUTPUT.PUT_LINE(
-    'DDL AUDIT: ' || l_event_type || ' operation on ' || 
-    l_object_type || ' ' || l_object_owner || '.' || l_object_name || 
-    ' at ' || TO_CHAR(l_timestamp, 'YYYY-MM-DD HH24:MI:SS.FF') || 
-    ' by user ' || l_user
-  );
+$audit_line
   
   -- In a real system, this would insert into an audit table:
   -- INSERT INTO DDL_AUDIT_LOG (
@@ -448,12 +404,12 @@ BEGIN
   --   l_timestamp, l_user, SYS.SQL_TEXT
   -- );
 END AUDIT_DDL_TRG;
-/"""
-        self.objects.append(ddl_trigger)
-        
-        # Logon trigger for security monitoring
-        logon_trigger = OracleObject("MONITOR_LOGON_TRG", "TRIGGER")
-        logon_trigger.sql = f"""-- System trigger to monitor database logon events
+/""").substitute(audit_line=_audit_put_line("'DDL AUDIT: ' || l_event_type || ' operation on '",
+                                            "l_object_type || ' ' || l_object_owner || '.' || l_object_name",
+                                            "' at ' || " + _audit_time("l_timestamp"),
+                                            "' by user ' || l_user"))
+
+_MONITOR_LOGON_TRG_SQL = string.Template("""-- System trigger to monitor database logon events
 CREATE OR REPLACE TRIGGER MONITOR_LOGON_TRG
 AFTER LOGON ON DATABASE
 DECLARE
@@ -470,12 +426,7 @@ BEGIN
   END IF;
   
   -- Log connection information (to output for this example)
-  DBMS_OUTPUT.PUT_LINE(
-    'LOGON: User ' || l_user || ' connected from ' || l_ip || 
-    ' (' || l_machine || ') at ' || 
-    TO_CHAR(l_timestamp, 'YYYY-MM-DD HH24:MI:SS.FF') || 
-    ' using ' || l_program
-  );
+$audit_line
   
   -- In a real system, this would insert into a security log table:
   -- INSERT INTO SECURITY_LOGON_LOG (
@@ -484,5 +435,128 @@ BEGIN
   --   l_user, l_ip, l_os_user, l_machine, l_program, l_timestamp
   -- );
 END MONITOR_LOGON_TRG;
-/"""
-        self.objects.append(logon_trigger)
+/""").substitute(audit_line=_audit_put_line("'LOGON: User ' || l_user || ' connected from ' || l_ip",
+                                            "' (' || l_machine || ') at '",
+                                            _audit_time("l_timestamp"),
+                                            "' using ' || l_program"))
+
+
+class TriggerGenerator(OracleObjectGenerator):
+    """
+    Generates Oracle trigger objects
+    """
+    # The triggers only depend on which tables are present, so the generated
+    # (name, type, SQL, dependencies) records are shared per table name sequence.
+    # Templated SQL stays a factory in the records and is only rendered when read.
+    _TRIGGER_CACHE: dict[tuple[str, ...], tuple[tuple[str, str, str | Callable[[], str], tuple[str, ...]], ...]] = {}
+    
+    def __init__(self):
+        super().__init__()
+        
+    def generate(self, tables: list[TableInfo], **kwargs) -> list[OracleObject]:
+        """Generate Oracle triggers for tables"""
+        cache_key = tuple(table_info.name for table_info in tables)
+        records = self._TRIGGER_CACHE.get(cache_key)
+        if records is not None:
+            self.objects.extend([OracleObject.from_record(*record) for record in records])
+            return self.objects
+        
+        # Generate different types of triggers based on table. ORDER_ITEMS is
+        # a child table and has no entry, so it gets no triggers. The triggers
+        # are collected locally and added to self.objects in one step.
+        triggers: list[OracleObject] = []
+        for table_info in tables:
+            handler = self._TABLE_TRIGGERS.get(table_info.name)
+            if handler:
+                triggers.extend(handler(self, table_info))
+        
+        # Generate system event triggers
+        triggers.extend(self._generate_system_event_triggers())
+        
+        self._TRIGGER_CACHE[cache_key] = tuple(trigger.to_lazy_record() for trigger in triggers)
+        self.objects.extend(triggers)
+        return self.objects
+        
+    def to_script(self) -> str:
+        """Get the generated triggers as one SQL*Plus script, each body terminated by a slash"""
+        return join_sql_script(self.objects)
+        
+    def _generate_employee_triggers(self, table_info: TableInfo) -> tuple[OracleObject, ...]:
+        """Generate triggers for the EMPLOYEES table"""
+        # Compound trigger for salary validation and audit
+        compound_trigger = OracleObject("EMPLOYEES_SALARY_CHK_TRG", "TRIGGER")
+        compound_trigger.set_sql_factory(_employees_salary_chk_trg_sql)
+        compound_trigger.add_dependency(_EMPLOYEES)
+        
+        # Row-level trigger for employee email standardization
+        email_trigger = OracleObject("EMPLOYEES_EMAIL_TRG", "TRIGGER")
+        email_trigger.sql = _EMPLOYEES_EMAIL_TRG_SQL
+        email_trigger.add_dependency(_EMPLOYEES)
+        
+        return compound_trigger, email_trigger
+        
+    def _generate_department_triggers(self, table_info: TableInfo) -> tuple[OracleObject, ...]:
+        """Generate triggers for the DEPARTMENTS table"""
+        # Before insert/update trigger for departments
+        dept_trigger = OracleObject("DEPARTMENTS_BIU_TRG", "TRIGGER")
+        dept_trigger.sql = _DEPARTMENTS_BIU_TRG_SQL
+        dept_trigger.add_dependency(_DEPARTMENTS)
+        
+        # Statement-level audit trigger
+        audit_trigger = OracleObject("DEPARTMENTS_AUDIT_TRG", "TRIGGER")
+        audit_trigger.sql = _DEPARTMENTS_AUDIT_TRG_SQL
+        audit_trigger.add_dependency(_DEPARTMENTS)
+        
+        return dept_trigger, audit_trigger
+        
+    def _generate_order_triggers(self, table_info: TableInfo) -> tuple[OracleObject, ...]:
+        """Generate triggers for the ORDERS table"""
+        # Trigger to calculate order total from items
+        order_total_trigger = OracleObject("ORDERS_UPD_TOTAL_TRG", "TRIGGER")
+        order_total_trigger.sql = _ORDERS_UPD_TOTAL_TRG_SQL
+        order_total_trigger.add_dependency(_ORDERS)
+        order_total_trigger.add_dependency(_ORDER_ITEMS)
+        
+        # Status change validation trigger
+        status_trigger = OracleObject("ORDERS_STATUS_CHK_TRG", "TRIGGER")
+        status_trigger.set_sql_factory(_orders_status_chk_trg_sql)
+        status_trigger.add_dependency(_ORDERS)
+        
+        return order_total_trigger, status_trigger
+        
+    def _generate_product_triggers(self, table_info: TableInfo) -> tuple[OracleObject, ...]:
+        """Generate triggers for the PRODUCTS table"""
+        # Price change notification trigger
+        price_trigger = OracleObject("PRODUCTS_PRICE_TRG", "TRIGGER")
+        price_trigger.sql = _PRODUCTS_PRICE_TRG_SQL
+        price_trigger.add_dependency(_PRODUCTS)
+        return (price_trigger,)
+        
+    def _generate_customer_triggers(self, table_info: TableInfo) -> tuple[OracleObject, ...]:
+        """Generate triggers for the CUSTOMERS table"""
+        # Customer data normalization trigger
+        customer_trigger = OracleObject("CUSTOMERS_NORM_TRG", "TRIGGER")
+        customer_trigger.sql = _CUSTOMERS_NORM_TRG_SQL
+        customer_trigger.add_dependency(_CUSTOMERS)
+        return (customer_trigger,)
+        
+    def _generate_system_event_triggers(self) -> tuple[OracleObject, ...]:
+        """Generate system event triggers"""
+        # DDL audit trigger
+        ddl_trigger = OracleObject("AUDIT_DDL_TRG", "TRIGGER")
+        ddl_trigger.sql = _AUDIT_DDL_TRG_SQL
+        
+        # Logon trigger for security monitoring
+        logon_trigger = OracleObject("MONITOR_LOGON_TRG", "TRIGGER")
+        logon_trigger.sql = _MONITOR_LOGON_TRG_SQL
+        
+        return ddl_trigger, logon_trigger
+        
+    # Trigger generator for each table that gets triggers
+    _TABLE_TRIGGERS: dict[str, Callable[[TriggerGenerator, TableInfo], tuple[OracleObject, ...]]] = {
+        _EMPLOYEES: _generate_employee_triggers,
+        _DEPARTMENTS: _generate_department_triggers,
+        _ORDERS: _generate_order_triggers,
+        _PRODUCTS: _generate_product_triggers,
+        _CUSTOMERS: _generate_customer_triggers,
+    }